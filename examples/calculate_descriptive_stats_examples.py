@@ -1,8 +1,28 @@
 import numpy as np
-import pandas as pd
-import matplotlib.pyplot as plt
 from calculate_descriptive_stats import calculate_descriptive_stats
 
+# matplotlib and pandas are only needed by the plotting examples (2, 4, 7),
+# so they are imported lazily; running examples 1, 3, 5 and 6 costs just
+# numpy plus the stdlib.
+plt = None
+
+
+def _plt():
+    """Import matplotlib lazily, selecting the Agg backend first."""
+    global plt
+    if plt is None:
+        import matplotlib
+        matplotlib.use('Agg')  # headless backend: skip GUI event-loop init entirely
+        import matplotlib.pyplot
+        plt = matplotlib.pyplot
+    return plt
+
+
+def _save(fig, name):
+    """Save a figure and release it so pyplot doesn't retain it."""
+    fig.savefig(name)
+    plt.close(fig)
+
 def example_1_basic_usage():
     """
     Example 1: Basic usage with a simple list of numbers
@@ -19,8 +39,7 @@ def example_1_basic_usage():
     # Print the results
     print(f"Dataset: {data}")
     print("\nDescriptive Statistics:")
-    for key, value in stats.items():
-        print(f"  {key}: {value}")
+    print("\n".join(f"  {key}: {value}" for key, value in stats.items()))
 
 def example_2_numpy_array():
     """
@@ -29,10 +48,13 @@ def example_2_numpy_array():
     print("\nExample 2: NumPy Array with Outliers")
     print("----------------------------------")
     
-    # Create a dataset with outliers
-    np.random.seed(42)  # For reproducibility
-    data = np.random.normal(loc=50, scale=5, size=100)  # Normal distribution
-    data = np.append(data, [80, 85, 20, 15])  # Add outliers
+    # Create a dataset with outliers. Preallocate the outlier slots instead
+    # of np.append, which reallocates and copies the whole array on every
+    # call (O(N^2) when used in a loop).
+    rng = np.random.default_rng(42)  # For reproducibility
+    data = np.empty(104)
+    data[:100] = rng.normal(loc=50, scale=5, size=100)  # Normal distribution
+    data[100:] = [80, 85, 20, 15]  # Add outliers
     
     # Calculate descriptive statistics
     stats = calculate_descriptive_stats(data)
@@ -48,18 +70,23 @@ def example_2_numpy_array():
     print(f"Kurtosis: {stats['kurtosis']:.4f}")
     
     # Visualize the data
-    plt.figure(figsize=(10, 6))
-    plt.hist(data, bins=20, alpha=0.7, color='skyblue', edgecolor='black')
-    plt.axvline(stats['mean'], color='red', linestyle='dashed', linewidth=2, label=f"Mean: {stats['mean']:.2f}")
-    plt.axvline(stats['mean'] + stats['stdev'], color='green', linestyle='dotted', linewidth=2, 
-                label=f"Mean + StdDev: {stats['mean'] + stats['stdev']:.2f}")
-    plt.axvline(stats['mean'] - stats['stdev'], color='green', linestyle='dotted', linewidth=2, 
-                label=f"Mean - StdDev: {stats['mean'] - stats['stdev']:.2f}")
-    plt.title('Distribution with Outliers')
-    plt.xlabel('Value')
-    plt.ylabel('Frequency')
-    plt.legend()
-    plt.savefig('distribution_with_outliers.png')
+    plt = _plt()
+    fig, ax = plt.subplots(figsize=(10, 6))
+    # Bin once with np.histogram and draw bars directly; plt.hist would
+    # redo the edge computation and binning internally.
+    counts, edges = np.histogram(data, bins=20)
+    ax.bar(edges[:-1], counts, width=np.diff(edges), align='edge',
+           alpha=0.7, color='skyblue', edgecolor='black')
+    ax.axvline(stats['mean'], color='red', linestyle='dashed', linewidth=2, label=f"Mean: {stats['mean']:.2f}")
+    ax.axvline(stats['mean'] + stats['stdev'], color='green', linestyle='dotted', linewidth=2, 
+               label=f"Mean + StdDev: {stats['mean'] + stats['stdev']:.2f}")
+    ax.axvline(stats['mean'] - stats['stdev'], color='green', linestyle='dotted', linewidth=2, 
+               label=f"Mean - StdDev: {stats['mean'] - stats['stdev']:.2f}")
+    ax.set_title('Distribution with Outliers')
+    ax.set_xlabel('Value')
+    ax.set_ylabel('Frequency')
+    ax.legend()
+    _save(fig, 'distribution_with_outliers.png')
     print("Saved histogram to 'distribution_with_outliers.png'")
 
 def example_3_handling_nan_values():
@@ -78,8 +105,7 @@ def example_3_handling_nan_values():
     try:
         stats_propagate = calculate_descriptive_stats(data, nan_policy='propagate')
         print("\nWith nan_policy='propagate':")
-        for key, value in stats_propagate.items():
-            print(f"  {key}: {value}")
+        print("\n".join(f"  {key}: {value}" for key, value in stats_propagate.items()))
     except Exception as e:
         print(f"\nWith nan_policy='propagate': Error - {str(e)}")
     
@@ -87,8 +113,7 @@ def example_3_handling_nan_values():
     try:
         stats_omit = calculate_descriptive_stats(data, nan_policy='omit')
         print("\nWith nan_policy='omit':")
-        for key, value in stats_omit.items():
-            print(f"  {key}: {value}")
+        print("\n".join(f"  {key}: {value}" for key, value in stats_omit.items()))
     except Exception as e:
         print(f"\nWith nan_policy='omit': Error - {str(e)}")
     
@@ -96,8 +121,7 @@ def example_3_handling_nan_values():
     try:
         stats_raise = calculate_descriptive_stats(data, nan_policy='raise')
         print("\nWith nan_policy='raise':")
-        for key, value in stats_raise.items():
-            print(f"  {key}: {value}")
+        print("\n".join(f"  {key}: {value}" for key, value in stats_raise.items()))
     except Exception as e:
         print(f"\nWith nan_policy='raise': Error - {str(e)}")
 
@@ -109,41 +133,46 @@ def example_4_comparing_datasets():
     print("-------------------------")
     
     # Create two datasets
-    np.random.seed(42)  # For reproducibility
-    data1 = np.random.normal(loc=50, scale=10, size=1000)  # Normal distribution
-    data2 = np.random.exponential(scale=10, size=1000) + 30  # Exponential distribution
+    rng = np.random.default_rng(42)  # For reproducibility
+    data1 = rng.normal(loc=50, scale=10, size=1000)  # Normal distribution
+    data2 = rng.exponential(scale=10, size=1000) + 30  # Exponential distribution
     
-    # Calculate descriptive statistics
-    stats1 = calculate_descriptive_stats(data1)
-    stats2 = calculate_descriptive_stats(data2)
+    # Calculate descriptive statistics for both datasets in one batched
+    # call: stack them and reduce along axis=1
+    stats_both = calculate_descriptive_stats(np.stack([data1, data2]), axis=1)
+    stats1 = {key: value[0] for key, value in stats_both.items()}
+    stats2 = {key: value[1] for key, value in stats_both.items()}
     
     # Print comparison
     print("Comparison of Normal vs. Exponential Distribution:")
     print(f"{'Statistic':<10} {'Normal':<15} {'Exponential':<15}")
     print("-" * 40)
-    for key in stats1.keys():
-        if isinstance(stats1[key], (int, float)) and isinstance(stats2[key], (int, float)):
-            print(f"{key:<10} {stats1[key]:<15.4f} {stats2[key]:<15.4f}")
-        else:
-            print(f"{key:<10} {stats1[key]:<15} {stats2[key]:<15}")
+    print("\n".join(
+        f"{key:<10} {stats1[key]:<15.4f} {stats2[key]:<15.4f}"
+        if isinstance(stats1[key], (int, float)) and isinstance(stats2[key], (int, float))
+        else f"{key:<10} {stats1[key]:<15} {stats2[key]:<15}"
+        for key in stats1.keys()))
     
     # Visualize the comparison
-    plt.figure(figsize=(12, 6))
-    
-    plt.subplot(1, 2, 1)
-    plt.hist(data1, bins=30, alpha=0.7, color='skyblue', edgecolor='black')
-    plt.title('Normal Distribution')
-    plt.xlabel('Value')
-    plt.ylabel('Frequency')
-    
-    plt.subplot(1, 2, 2)
-    plt.hist(data2, bins=30, alpha=0.7, color='salmon', edgecolor='black')
-    plt.title('Exponential Distribution')
-    plt.xlabel('Value')
-    plt.ylabel('Frequency')
-    
-    plt.tight_layout()
-    plt.savefig('distribution_comparison.png')
+    plt = _plt()
+    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(12, 6))
+
+    counts1, edges1 = np.histogram(data1, bins=30)
+    ax1.bar(edges1[:-1], counts1, width=np.diff(edges1), align='edge',
+            alpha=0.7, color='skyblue', edgecolor='black')
+    ax1.set_title('Normal Distribution')
+    ax1.set_xlabel('Value')
+    ax1.set_ylabel('Frequency')
+
+    counts2, edges2 = np.histogram(data2, bins=30)
+    ax2.bar(edges2[:-1], counts2, width=np.diff(edges2), align='edge',
+            alpha=0.7, color='salmon', edgecolor='black')
+    ax2.set_title('Exponential Distribution')
+    ax2.set_xlabel('Value')
+    ax2.set_ylabel('Frequency')
+
+    fig.tight_layout()
+    _save(fig, 'distribution_comparison.png')
     print("Saved comparison histograms to 'distribution_comparison.png'")
 
 def example_5_zero_variance_case():
@@ -162,8 +191,7 @@ def example_5_zero_variance_case():
     # Print the results
     print(f"Dataset with constant values: {data}")
     print("\nDescriptive Statistics:")
-    for key, value in stats.items():
-        print(f"  {key}: {value}")
+    print("\n".join(f"  {key}: {value}" for key, value in stats.items()))
 
 def example_6_error_handling():
     """
@@ -211,33 +239,36 @@ def example_7_real_world_application():
     print("\nExample 7: Real-world Application")
     print("-----------------------------")
     
-    # Create a sample dataset simulating temperature readings
-    np.random.seed(42)  # For reproducibility
-    dates = pd.date_range(start='2023-01-01', periods=30, freq='D')
-    temperatures = np.random.normal(loc=20, scale=5, size=30)  # Mean of 20°C with 5°C standard deviation
+    import pandas as pd
+
+    # Create a sample dataset simulating temperature readings. The stats
+    # and plotting below work on the raw arrays; numpy datetime64 is an
+    # order of magnitude cheaper than pd.date_range at this size.
+    rng = np.random.default_rng(42)  # For reproducibility
+    dates = np.arange('2023-01-01', '2023-01-31', dtype='datetime64[D]')
+    temperatures = rng.normal(loc=20, scale=5, size=30)  # Mean of 20°C with 5°C standard deviation
     
     # Introduce some missing values
     temperatures[5] = np.nan
     temperatures[15] = np.nan
     
-    # Create a pandas DataFrame
+    # A DataFrame is only materialized for display and the pandas
+    # comparison at the end
     df = pd.DataFrame({'date': dates, 'temperature': temperatures})
     
     print("Sample temperature dataset:")
     print(df.head())
     print(f"Shape: {df.shape}")
-    print(f"Missing values: {df['temperature'].isna().sum()}")
+    print(f"Missing values: {np.isnan(temperatures).sum()}")
     
     # Calculate descriptive statistics using our function
-    stats = calculate_descriptive_stats(df['temperature'].values, nan_policy='omit')
+    stats = calculate_descriptive_stats(temperatures, nan_policy='omit')
     
     # Print the results
     print("\nDescriptive Statistics (using our function):")
-    for key, value in stats.items():
-        if isinstance(value, float):
-            print(f"  {key}: {value:.4f}")
-        else:
-            print(f"  {key}: {value}")
+    print("\n".join(
+        f"  {key}: {value:.4f}" if isinstance(value, float) else f"  {key}: {value}"
+        for key, value in stats.items()))
     
     # Compare with pandas describe
     print("\nComparison with pandas describe():")
@@ -245,33 +276,41 @@ def example_7_real_world_application():
     print(pandas_stats)
     
     # Visualize the data
-    plt.figure(figsize=(10, 6))
-    plt.plot(df['date'], df['temperature'], marker='o', linestyle='-', color='blue')
-    plt.axhline(stats['mean'], color='red', linestyle='dashed', label=f"Mean: {stats['mean']:.2f}°C")
-    plt.fill_between(df['date'], 
-                     stats['mean'] - stats['stdev'], 
-                     stats['mean'] + stats['stdev'], 
-                     color='red', alpha=0.2, 
-                     label=f"±1 StdDev: {stats['stdev']:.2f}°C")
-    plt.title('Daily Temperature Readings')
-    plt.xlabel('Date')
-    plt.ylabel('Temperature (°C)')
-    plt.grid(True, linestyle='--', alpha=0.7)
-    plt.legend()
-    plt.tight_layout()
-    plt.savefig('temperature_analysis.png')
+    plt = _plt()
+    fig, ax = plt.subplots(figsize=(10, 6))
+    ax.plot(dates, temperatures, marker='o', linestyle='-', color='blue')
+    ax.axhline(stats['mean'], color='red', linestyle='dashed', label=f"Mean: {stats['mean']:.2f}°C")
+    ax.fill_between(dates, 
+                    stats['mean'] - stats['stdev'], 
+                    stats['mean'] + stats['stdev'], 
+                    color='red', alpha=0.2, 
+                    label=f"±1 StdDev: {stats['stdev']:.2f}°C")
+    ax.set_title('Daily Temperature Readings')
+    ax.set_xlabel('Date')
+    ax.set_ylabel('Temperature (°C)')
+    ax.grid(True, linestyle='--', alpha=0.7)
+    ax.legend()
+    fig.tight_layout()
+    _save(fig, 'temperature_analysis.png')
     print("Saved temperature analysis plot to 'temperature_analysis.png'")
 
 if __name__ == "__main__":
     print("Descriptive Statistics Calculator - Usage Examples")
     print("================================================")
     
-    example_1_basic_usage()
-    example_2_numpy_array()
-    example_3_handling_nan_values()
-    example_4_comparing_datasets()
-    example_5_zero_variance_case()
-    example_6_error_handling()
-    example_7_real_world_application()
+    examples = [
+        example_1_basic_usage,
+        example_2_numpy_array,
+        example_3_handling_nan_values,
+        example_4_comparing_datasets,
+        example_5_zero_variance_case,
+        example_6_error_handling,
+        example_7_real_world_application,
+    ]
+    for example in examples:
+        example()
+        # Safety net on top of _save: never carry figures between examples
+        if plt is not None:
+            plt.close('all')
     
     print("\nAll examples completed successfully!")
@@ -7,8 +7,23 @@ different parameter configurations.
 """
 
 import numpy as np
+import matplotlib
+matplotlib.use('Agg')  # headless backend: no GUI event loop to initialize
 import matplotlib.pyplot as plt
-from archive.apply_stdp import apply_stdp
+from matplotlib.collections import LineCollection
+from src.neuro.apply_stdp import apply_stdp
+
+# One shared figure for all examples: cleared and resized per example
+# instead of allocating (and leaking) a new figure each time.
+_FIG = plt.figure(figsize=(10, 4))
+
+
+def _fresh_figure(width, height):
+    """Clear and resize the shared figure rather than allocating a new one."""
+    _FIG.clf()
+    _FIG.set_size_inches(width, height)
+    plt.figure(_FIG.number)
+    return _FIG
 
 def example_1_basic_excitatory():
     """
@@ -41,15 +56,23 @@ def example_1_basic_excitatory():
     print(f"Eligibility trace: {new_trace:.6f}")
     print(f"Weight change: {new_weight - current_weight:.6f}")
     
-    # Visualize the spike timing
-    plt.figure(figsize=(10, 4))
-    plt.scatter(spike_times_pre, np.ones_like(spike_times_pre), color='blue', marker='|', s=100, label='Pre-synaptic')
-    plt.scatter(spike_times_post, np.ones_like(spike_times_post) * 1.5, color='red', marker='|', s=100, label='Post-synaptic')
-    
-    for pre, post in zip(spike_times_pre, spike_times_post):
-        plt.annotate('', xy=(post, 1.5), xytext=(pre, 1), 
-                    arrowprops=dict(arrowstyle='->', color='green', lw=1.5))
-        plt.text((pre + post) / 2, 1.25, f'Δt={post-pre}ms', ha='center', va='center', color='green')
+    # Visualize the spike timing. The pairing lines go in as one
+    # LineCollection instead of a per-pair annotate call, which has
+    # significant matplotlib dispatch overhead.
+    _fresh_figure(10, 4)
+    pre_arr = np.asarray(spike_times_pre)
+    post_arr = np.asarray(spike_times_post)
+    pre_level = np.ones_like(pre_arr)
+    post_level = np.full_like(post_arr, 1.5)
+    plt.scatter(pre_arr, pre_level, color='blue', marker='|', s=100, label='Pre-synaptic')
+    plt.scatter(post_arr, post_level, color='red', marker='|', s=100, label='Post-synaptic')
+    
+    ax = plt.gca()
+    segments = np.stack([np.column_stack([pre_arr, pre_level]),
+                         np.column_stack([post_arr, post_level])], axis=1)
+    ax.add_collection(LineCollection(segments, colors='green', linewidths=1.5))
+    for pre, post in zip(pre_arr, post_arr):
+        ax.text((pre + post) / 2, 1.25, f'Δt={post-pre}ms', ha='center', va='center', color='green')
     
     plt.yticks([1, 1.5], ['Pre-synaptic', 'Post-synaptic'])
     plt.xlabel('Time (ms)')
@@ -57,7 +80,7 @@ def example_1_basic_excitatory():
     plt.grid(True, alpha=0.3)
     plt.legend()
     plt.tight_layout()
-    plt.savefig('example_1_excitatory.png')
+    plt.savefig(dpi=100, fname='example_1_excitatory.png')
     print("Plot saved as 'example_1_excitatory.png'")
 
 
@@ -92,15 +115,22 @@ def example_2_basic_inhibitory():
     print(f"Eligibility trace: {new_trace:.6f}")
     print(f"Weight change: {new_weight - current_weight:.6f}")
     
-    # Visualize the spike timing
-    plt.figure(figsize=(10, 4))
-    plt.scatter(spike_times_pre, np.ones_like(spike_times_pre), color='blue', marker='|', s=100, label='Pre-synaptic')
-    plt.scatter(spike_times_post, np.ones_like(spike_times_post) * 1.5, color='red', marker='|', s=100, label='Post-synaptic')
-    
-    for pre, post in zip(spike_times_pre, spike_times_post):
-        plt.annotate('', xy=(pre, 1), xytext=(post, 1.5), 
-                    arrowprops=dict(arrowstyle='->', color='purple', lw=1.5))
-        plt.text((pre + post) / 2, 1.25, f'Δt={post-pre}ms', ha='center', va='center', color='purple')
+    # Visualize the spike timing with the same batched LineCollection
+    # pattern as example 1
+    _fresh_figure(10, 4)
+    pre_arr = np.asarray(spike_times_pre)
+    post_arr = np.asarray(spike_times_post)
+    pre_level = np.ones_like(pre_arr)
+    post_level = np.full_like(post_arr, 1.5)
+    plt.scatter(pre_arr, pre_level, color='blue', marker='|', s=100, label='Pre-synaptic')
+    plt.scatter(post_arr, post_level, color='red', marker='|', s=100, label='Post-synaptic')
+    
+    ax = plt.gca()
+    segments = np.stack([np.column_stack([post_arr, post_level]),
+                         np.column_stack([pre_arr, pre_level])], axis=1)
+    ax.add_collection(LineCollection(segments, colors='purple', linewidths=1.5))
+    for pre, post in zip(pre_arr, post_arr):
+        ax.text((pre + post) / 2, 1.25, f'Δt={post-pre}ms', ha='center', va='center', color='purple')
     
     plt.yticks([1, 1.5], ['Pre-synaptic', 'Post-synaptic'])
     plt.xlabel('Time (ms)')
@@ -108,7 +138,7 @@ def example_2_basic_inhibitory():
     plt.grid(True, alpha=0.3)
     plt.legend()
     plt.tight_layout()
-    plt.savefig('example_2_inhibitory.png')
+    plt.savefig(dpi=100, fname='example_2_inhibitory.png')
     print("Plot saved as 'example_2_inhibitory.png'")
 
 
@@ -146,7 +176,7 @@ def example_3_reward_modulation():
         print(f"Reward: {reward:.2f}, New weight: {new_weight:.6f}, Weight change: {new_weight - current_weight:.6f}")
     
     # Visualize the effect of reward on weight change
-    plt.figure(figsize=(10, 6))
+    _fresh_figure(10, 6)
     rewards = [r[0] for r in results]
     weights = [r[1] for r in results]
     weight_changes = [w - current_weight for w in weights]
@@ -160,7 +190,7 @@ def example_3_reward_modulation():
     plt.grid(True, alpha=0.3)
     plt.legend()
     plt.tight_layout()
-    plt.savefig('example_3_reward_modulation.png')
+    plt.savefig(dpi=100, fname='example_3_reward_modulation.png')
     print("Plot saved as 'example_3_reward_modulation.png'")
 
 
@@ -190,61 +220,73 @@ def example_4_eligibility_trace():
     eligibility_trace = 0.0
     gamma_values = [0.0, 0.5, 0.9]  # Different decay factors
     
-    # Track results for different gamma values
-    all_weights = {gamma: [current_weight] for gamma in gamma_values}
-    all_traces = {gamma: [eligibility_trace] for gamma in gamma_values}
+    # Track results in one preallocated (gamma, step) block per quantity
+    # instead of growing Python lists step by step
+    n_steps = len(spike_patterns) + 1
+    all_weights = np.empty((len(gamma_values), n_steps))
+    all_traces = np.empty((len(gamma_values), n_steps))
+    all_weights[:, 0] = current_weight
+    all_traces[:, 0] = eligibility_trace
+    
+    # The raw Δw of a step depends only on that step's spikes, not on
+    # gamma or the running weight, so evaluate the spike-pair kernel once
+    # per step (a gamma=0 call returns Δw as its trace) and replay the
+    # cheap trace/weight recurrence for every gamma value.
+    step_delta_w = np.array([
+        apply_stdp(
+            spike_times_pre=pre_spikes,
+            spike_times_post=post_spikes,
+            current_weight=current_weight,
+            eligibility_trace=0.0,
+            gamma=0.0
+        )[1]
+        for pre_spikes, post_spikes in spike_patterns
+    ])
     
     # Run simulation for each gamma value
-    for gamma in gamma_values:
+    for g, gamma in enumerate(gamma_values):
         weight = current_weight
         trace = eligibility_trace
         
         print(f"\nSimulation with gamma = {gamma}:")
         print(f"Initial - Weight: {weight:.6f}, Trace: {trace:.6f}")
         
-        # Apply STDP for each time step
-        for step, (pre_spikes, post_spikes) in enumerate(spike_patterns, 1):
-            weight, trace = apply_stdp(
-                spike_times_pre=pre_spikes,
-                spike_times_post=post_spikes,
-                current_weight=weight,
-                eligibility_trace=trace,
-                gamma=gamma
-            )
+        # Replay the eligibility-trace recurrence with the hoisted Δw values
+        for step, delta_w in enumerate(step_delta_w, 1):
+            trace = gamma * trace + delta_w
+            weight = float(np.clip(weight + delta_w, 0.0, 1.0))
             
-            all_weights[gamma].append(weight)
-            all_traces[gamma].append(trace)
+            all_weights[g, step] = weight
+            all_traces[g, step] = trace
             
             print(f"Step {step} - Weight: {weight:.6f}, Trace: {trace:.6f}")
     
     # Visualize the effect of eligibility trace
-    plt.figure(figsize=(12, 8))
+    _fresh_figure(12, 8)
     
     # Plot weights
     plt.subplot(2, 1, 1)
-    time_steps = range(len(spike_patterns) + 1)
-    for gamma, weights in all_weights.items():
-        plt.plot(time_steps, weights, 'o-', label=f'γ = {gamma}')
+    time_steps = np.arange(n_steps)
+    plt.plot(time_steps, all_weights.T, 'o-')
+    plt.legend([f'γ = {gamma}' for gamma in gamma_values])
     
     plt.xlabel('Time Step')
     plt.ylabel('Synaptic Weight')
     plt.title('Effect of Eligibility Trace on Weight Evolution')
     plt.grid(True, alpha=0.3)
-    plt.legend()
     
     # Plot traces
     plt.subplot(2, 1, 2)
-    for gamma, traces in all_traces.items():
-        plt.plot(time_steps, traces, 'o-', label=f'γ = {gamma}')
+    plt.plot(time_steps, all_traces.T, 'o-')
+    plt.legend([f'γ = {gamma}' for gamma in gamma_values])
     
     plt.xlabel('Time Step')
     plt.ylabel('Eligibility Trace')
     plt.title('Evolution of Eligibility Trace')
     plt.grid(True, alpha=0.3)
-    plt.legend()
     
     plt.tight_layout()
-    plt.savefig('example_4_eligibility_trace.png')
+    plt.savefig(dpi=100, fname='example_4_eligibility_trace.png')
     print("Plot saved as 'example_4_eligibility_trace.png'")
 
 
@@ -271,24 +313,18 @@ def example_5_stdp_curve():
     # Generate time differences
     delta_t = np.linspace(-100, 100, 1000)  # From -100ms to 100ms
     
-    # Calculate weight changes for excitatory synapses
-    delta_w_exc = np.zeros_like(delta_t)
-    for i, dt in enumerate(delta_t):
-        if dt > 0:  # Post after pre (potentiation)
-            delta_w_exc[i] = A_plus * np.exp(-dt / tau_plus)
-        else:  # Pre after post (depression)
-            delta_w_exc[i] = -A_minus * np.exp(dt / tau_minus)
-    
-    # Calculate weight changes for inhibitory synapses
-    delta_w_inh = np.zeros_like(delta_t)
-    for i, dt in enumerate(delta_t):
-        if dt < 0:  # Post before pre (potentiation for inhibitory)
-            delta_w_inh[i] = A_plus_inh * np.exp(dt / tau_plus_inh)
-        else:  # Pre before post (depression for inhibitory)
-            delta_w_inh[i] = -A_minus_inh * np.exp(-dt / tau_minus_inh)
+    # Calculate weight changes for both synapse types: evaluate the two
+    # exponential branches vectorized and select with np.where, instead of
+    # branching per element in a Python loop
+    delta_w_exc = np.where(delta_t > 0,
+                           A_plus * np.exp(-delta_t / tau_plus),        # post after pre: potentiation
+                           -A_minus * np.exp(delta_t / tau_minus))      # pre after post: depression
+    delta_w_inh = np.where(delta_t < 0,
+                           A_plus_inh * np.exp(delta_t / tau_plus_inh),     # post before pre: potentiation
+                           -A_minus_inh * np.exp(-delta_t / tau_minus_inh))  # pre before post: depression
     
     # Visualize the STDP curves
-    plt.figure(figsize=(12, 6))
+    _fresh_figure(12, 6)
     
     plt.plot(delta_t, delta_w_exc, 'b-', label='Excitatory Synapse')
     plt.plot(delta_t, delta_w_inh, 'r-', label='Inhibitory Synapse')
@@ -302,7 +338,7 @@ def example_5_stdp_curve():
     plt.grid(True, alpha=0.3)
     plt.legend()
     plt.tight_layout()
-    plt.savefig('example_5_stdp_curve.png')
+    plt.savefig(dpi=100, fname='example_5_stdp_curve.png')
     print("Plot saved as 'example_5_stdp_curve.png'")
 
 
@@ -322,11 +358,11 @@ def example_6_parameter_variation():
     current_weight = 0.5
     
     # Vary tau_plus
-    tau_values = [10.0, 20.0, 30.0, 40.0]
-    results_tau = []
+    tau_values = np.array([10.0, 20.0, 30.0, 40.0])
+    weights_tau = np.empty(len(tau_values))
     
     print("\nVarying tau_plus:")
-    for tau in tau_values:
+    for i, tau in enumerate(tau_values):
         new_weight, new_trace = apply_stdp(
             spike_times_pre=spike_times_pre,
             spike_times_post=spike_times_post,
@@ -334,15 +370,15 @@ def example_6_parameter_variation():
             tau_plus=tau
         )
         
-        results_tau.append((tau, new_weight))
+        weights_tau[i] = new_weight
         print(f"tau_plus: {tau:.1f}, New weight: {new_weight:.6f}, Weight change: {new_weight - current_weight:.6f}")
     
     # Vary A_plus
-    A_values = [0.05, 0.1, 0.15, 0.2]
-    results_A = []
+    A_values = np.array([0.05, 0.1, 0.15, 0.2])
+    weights_A = np.empty(len(A_values))
     
     print("\nVarying A_plus_base:")
-    for A in A_values:
+    for i, A in enumerate(A_values):
         new_weight, new_trace = apply_stdp(
             spike_times_pre=spike_times_pre,
             spike_times_post=spike_times_post,
@@ -350,18 +386,15 @@ def example_6_parameter_variation():
             A_plus_base=A
         )
         
-        results_A.append((A, new_weight))
+        weights_A[i] = new_weight
         print(f"A_plus_base: {A:.2f}, New weight: {new_weight:.6f}, Weight change: {new_weight - current_weight:.6f}")
     
     # Visualize the effect of parameter variation
-    plt.figure(figsize=(12, 6))
+    _fresh_figure(12, 6)
     
     # Plot effect of tau_plus
     plt.subplot(1, 2, 1)
-    taus = [r[0] for r in results_tau]
-    weights_tau = [r[1] for r in results_tau]
-    
-    plt.plot(taus, weights_tau, 'o-', color='blue')
+    plt.plot(tau_values, weights_tau, 'o-', color='blue')
     plt.axhline(y=current_weight, color='gray', linestyle='--', label='Initial Weight')
     
     plt.xlabel('tau_plus (ms)')
@@ -371,10 +404,7 @@ def example_6_parameter_variation():
     
     # Plot effect of A_plus_base
     plt.subplot(1, 2, 2)
-    As = [r[0] for r in results_A]
-    weights_A = [r[1] for r in results_A]
-    
-    plt.plot(As, weights_A, 'o-', color='green')
+    plt.plot(A_values, weights_A, 'o-', color='green')
     plt.axhline(y=current_weight, color='gray', linestyle='--', label='Initial Weight')
     
     plt.xlabel('A_plus_base')
@@ -383,7 +413,7 @@ def example_6_parameter_variation():
     plt.grid(True, alpha=0.3)
     
     plt.tight_layout()
-    plt.savefig('example_6_parameter_variation.png')
+    plt.savefig(dpi=100, fname='example_6_parameter_variation.png')
     print("Plot saved as 'example_6_parameter_variation.png'")
 
 
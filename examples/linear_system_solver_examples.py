@@ -1,6 +1,12 @@
 import numpy as np
 from linear_system_solver import linear_system_solver
 
+
+def _verified(A, x, b, tol=1e-8):
+    """Relative residual check: one fused matvec and norm, no elementwise
+    tolerance array like np.allclose builds."""
+    return np.linalg.norm(A @ x - b) <= tol * (1 + np.linalg.norm(b))
+
 def example_1_simple_2x2():
     """
     Example 1: Simple 2x2 system
@@ -14,14 +20,14 @@ def example_1_simple_2x2():
     print("x + y = 3")
     
     # Define the coefficient matrix and right-hand side vector
-    A = np.array([[3, 2], [1, 1]])
-    b = np.array([7, 3])
+    A = np.array([[3, 2], [1, 1]], dtype=np.float64)
+    b = np.array([7, 3], dtype=np.float64)
     
     # Solve the system
     x = linear_system_solver(A, b)
     
     print(f"Solution: x = {x[0]}, y = {x[1]}")
-    print(f"Verification: {np.allclose(np.dot(A, x), b)}")
+    print(f"Verification: {_verified(A, x, b)}")
 
 def example_2_3x3_system():
     """
@@ -38,14 +44,14 @@ def example_2_3x3_system():
     print("x + 3y + 5z = 14")
     
     # Define the coefficient matrix and right-hand side vector
-    A = np.array([[2, 1, 1], [3, 5, 2], [1, 3, 5]])
-    b = np.array([5, 15, 14])
+    A = np.array([[2, 1, 1], [3, 5, 2], [1, 3, 5]], dtype=np.float64)
+    b = np.array([5, 15, 14], dtype=np.float64)
     
     # Solve the system
     x = linear_system_solver(A, b)
     
     print(f"Solution: x = {x[0]}, y = {x[1]}, z = {x[2]}")
-    print(f"Verification: {np.allclose(np.dot(A, x), b)}")
+    print(f"Verification: {_verified(A, x, b)}")
 
 def example_3_list_inputs():
     """
@@ -67,7 +73,7 @@ def example_3_list_inputs():
     x = linear_system_solver(A, b)
     
     print(f"Solution: x = {x[0]}, y = {x[1]}")
-    print(f"Verification: {np.allclose(np.dot(A, x), b)}")
+    print(f"Verification: {_verified(A, x, b)}")
 
 def example_4_engineering_application():
     """
@@ -88,14 +94,14 @@ def example_4_engineering_application():
     print("0I1 - 2I2 + 6I3 = 6   (Loop 3)")
     
     # Define the coefficient matrix and right-hand side vector
-    A = np.array([[10, -4, 0], [-4, 8, -2], [0, -2, 6]])
-    b = np.array([12, 0, 6])
+    A = np.array([[10, -4, 0], [-4, 8, -2], [0, -2, 6]], dtype=np.float64)
+    b = np.array([12, 0, 6], dtype=np.float64)
     
     # Solve the system
     x = linear_system_solver(A, b)
     
     print(f"Solution: I1 = {x[0]:.4f} A, I2 = {x[1]:.4f} A, I3 = {x[2]:.4f} A")
-    print(f"Verification: {np.allclose(np.dot(A, x), b)}")
+    print(f"Verification: {_verified(A, x, b)}")
 
 def example_5_error_handling():
     """
@@ -1,21 +1,50 @@
 import numpy as np
 import matplotlib.pyplot as plt
+from concurrent.futures import ThreadPoolExecutor
 from src.tda import compute_persistent_homology, calculate_tda_metrics
-from ripser import plot_dgms
+from src.tda.compute_persistent_homology import HAS_PARALLEL_BACKEND
+from persim import plot_diagrams
 
-def example_two_clusters():
-    """
-    An example demonstrating TDA on a point cloud with two distinct clusters.
-    """
-    print("--- Example: Two Clusters ---")
-    # Generate data: two clusters of points
-    points = np.vstack([
+def _two_cluster_points():
+    """Point cloud with two distinct clusters."""
+    return np.vstack([
         np.random.randn(20, 2) + [2, 2],
         np.random.randn(20, 2) + [-2, -2]
     ])
 
-    # Compute persistent homology
-    result = compute_persistent_homology(points, max_dim=1)
+def _circle_points():
+    """Noisy point cloud on a circle (one prominent 1-dimensional loop)."""
+    t = np.linspace(0, 2 * np.pi, 40, endpoint=False)
+    points = np.array([np.cos(t), np.sin(t)]).T
+    points += 0.1 * np.random.randn(*points.shape)
+    return points
+
+def _compute_homologies(clouds):
+    """
+    Compute persistent homology for several point clouds concurrently.
+
+    Ripser's C++ core releases the GIL while it reduces the boundary
+    matrix, so dispatching the independent clouds through a thread pool
+    overlaps their computation instead of paying each cost serially.
+    When the giotto-ph backend is active it already saturates the cores
+    itself, so the clouds are processed serially to avoid
+    oversubscription.
+    """
+    if HAS_PARALLEL_BACKEND:
+        return [compute_persistent_homology(points, max_dim=1) for points in clouds]
+    with ThreadPoolExecutor() as executor:
+        return list(executor.map(
+            lambda points: compute_persistent_homology(points, max_dim=1), clouds))
+
+def example_two_clusters(points=None, result=None):
+    """
+    An example demonstrating TDA on a point cloud with two distinct clusters.
+    """
+    print("--- Example: Two Clusters ---")
+    if points is None:
+        points = _two_cluster_points()
+    if result is None:
+        result = compute_persistent_homology(points, max_dim=1)
     diagrams = result['dgms']
 
     # Calculate TDA metrics
@@ -27,28 +56,25 @@ def example_two_clusters():
     plt.subplot(1, 2, 1)
     plt.scatter(points[:, 0], points[:, 1], s=10)
     plt.title("Point Cloud: Two Clusters")
-    
+
     plt.subplot(1, 2, 2)
-    plot_dgms(diagrams, show=False)
+    plot_diagrams(diagrams, show=False)
     plt.title("Persistence Diagram")
-    
+
     plt.tight_layout()
     plt.savefig("tda_example_two_clusters.png")
     plt.show()
 
-def example_circle():
+def example_circle(points=None, result=None):
     """
     An example demonstrating TDA on a point cloud forming a circle,
     which should have a prominent 1-dimensional feature (a loop).
     """
     print("\n--- Example: Circle ---")
-    # Generate data: points on a circle
-    t = np.linspace(0, 2 * np.pi, 40, endpoint=False)
-    points = np.array([np.cos(t), np.sin(t)]).T
-    points += 0.1 * np.random.randn(*points.shape)
-
-    # Compute persistent homology
-    result = compute_persistent_homology(points, max_dim=1)
+    if points is None:
+        points = _circle_points()
+    if result is None:
+        result = compute_persistent_homology(points, max_dim=1)
     diagrams = result['dgms']
 
     # Calculate TDA metrics
@@ -63,7 +89,7 @@ def example_circle():
     plt.axis('equal')
 
     plt.subplot(1, 2, 2)
-    plot_dgms(diagrams, show=False)
+    plot_diagrams(diagrams, show=False)
     plt.title("Persistence Diagram")
 
     plt.tight_layout()
@@ -71,5 +97,8 @@ def example_circle():
     plt.show()
 
 if __name__ == '__main__':
-    example_two_clusters()
-    example_circle()
+    # Batch the homology computations across clouds before reporting
+    clouds = [_two_cluster_points(), _circle_points()]
+    results = _compute_homologies(clouds)
+    example_two_clusters(clouds[0], results[0])
+    example_circle(clouds[1], results[1])
@@ -0,0 +1,5 @@
+from .calculate_descriptive_stats import calculate_descriptive_stats
+from .linear_system_solver import linear_system_solver
+from .numerical_integrate import numerical_integrate
+from .numerical_ode_solver import numerical_ode_solver
+from .symbolic_differentiation import symbolic_differentiate, symbolic_differentiate_compiled
@@ -1,19 +1,165 @@
 import numpy as np
-from scipy import stats
 
-def calculate_descriptive_stats(data, nan_policy='propagate'):
+# Optional accelerator, following the pattern in src/neuro/apply_stdp.py:
+# with numba all four central moments plus the extremes come out of one
+# fused Welford pass over the data.
+try:
+    import numba as _numba
+except ImportError:
+    _numba = None
+
+if _numba is not None:
+
+    @_numba.njit(cache=True)
+    def _moments_jit(values):  # pragma: no cover - exercised only with numba installed
+        n = 0
+        mean = 0.0
+        m2 = 0.0
+        m3 = 0.0
+        m4 = 0.0
+        minimum = values[0]
+        maximum = values[0]
+        for x in values:
+            if x < minimum:
+                minimum = x
+            if x > maximum:
+                maximum = x
+            n += 1
+            delta = x - mean
+            delta_n = delta / n
+            delta_n2 = delta_n * delta_n
+            term1 = delta * delta_n * (n - 1)
+            mean += delta_n
+            m4 += term1 * delta_n2 * (n * n - 3 * n + 3) + 6.0 * delta_n2 * m2 - 4.0 * delta_n * m3
+            m3 += term1 * delta_n * (n - 2) - 3.0 * delta_n * m2
+            m2 += term1
+        return n, mean, m2, m3, m4, minimum, maximum
+
+
+def _stats_core(values):
+    """
+    Compute all descriptive statistics from a single centered workspace.
+
+    One pass establishes the mean; the centered differences are then
+    reused for the second, third and fourth moments, so the data is
+    traversed twice in total instead of once per statistic. Moment
+    conventions match ``scipy.stats.describe``: sample variance (ddof=1),
+    biased skewness, and Fisher (excess) kurtosis.
+    """
+    if _numba is not None:
+        n, mean, m2_total, m3_total, m4_total, minimum, maximum = _moments_jit(
+            np.ascontiguousarray(values, dtype=np.float64))
+        variance = m2_total / (n - 1)
+        return {
+            'count': int(n),
+            'mean': float(mean),
+            'variance': float(variance),
+            'stdev': float(np.sqrt(variance)),
+            'min': float(minimum),
+            'max': float(maximum),
+            'median': float(np.median(values)),
+            'skewness': float(np.sqrt(n) * m3_total / m2_total ** 1.5) if m2_total > 0 else 0.0,
+            'kurtosis': float(n * m4_total / (m2_total * m2_total) - 3.0) if m2_total > 0 else 0.0
+        }
+
+    n = values.size
+    mean = values.mean()
+    centered = values - mean
+    squared = centered * centered
+    m2 = squared.mean()
+    m3 = (squared * centered).mean()
+    m4 = (squared * squared).mean()
+    variance = m2 * n / (n - 1)
+    # One shared sort serves every order statistic: min, max and median
+    # come from the same array instead of one traversal each
+    sorted_values = np.sort(values)
+    mid = n // 2
+    median = sorted_values[mid] if n % 2 else 0.5 * (sorted_values[mid - 1] + sorted_values[mid])
+    return {
+        'count': int(n),
+        'mean': float(mean),
+        'variance': float(variance),
+        'stdev': float(np.sqrt(variance)),
+        'min': float(sorted_values[0]),
+        'max': float(sorted_values[-1]),
+        'median': float(median),
+        'skewness': float(m3 / m2 ** 1.5) if m2 > 0 else 0.0,
+        'kurtosis': float(m4 / (m2 * m2) - 3.0) if m2 > 0 else 0.0
+    }
+
+
+def _stats_core_axis(values, axis, omit):
+    """
+    Vectorized moment computation along an axis of a stacked array.
+
+    Mirrors the conventions of ``_stats_core`` (ddof=1 variance, biased
+    skewness, Fisher kurtosis) but reduces along ``axis`` with NumPy
+    broadcasting, so a batch of datasets is processed in one pass per
+    moment instead of one Python call per dataset.
+    """
+    if omit:
+        count = np.sum(~np.isnan(values), axis=axis)
+        mean = np.nanmean(values, axis=axis)
+        centered = values - np.expand_dims(mean, axis)
+        squared = centered * centered
+        m2 = np.nanmean(squared, axis=axis)
+        m3 = np.nanmean(squared * centered, axis=axis)
+        m4 = np.nanmean(squared * squared, axis=axis)
+        dmin = np.nanmin(values, axis=axis)
+        dmax = np.nanmax(values, axis=axis)
+        median = np.nanmedian(values, axis=axis)
+    else:
+        # Propagate semantics mirror the 1-D path: moments (and the
+        # median) go NaN wherever a slice contains NaN, while count,
+        # min and max are reported over the non-NaN values
+        count = np.sum(~np.isnan(values), axis=axis)
+        mean = np.mean(values, axis=axis)
+        centered = values - np.expand_dims(mean, axis)
+        squared = centered * centered
+        m2 = np.mean(squared, axis=axis)
+        m3 = np.mean(squared * centered, axis=axis)
+        m4 = np.mean(squared * squared, axis=axis)
+        dmin = np.nanmin(values, axis=axis)
+        dmax = np.nanmax(values, axis=axis)
+        median = np.median(values, axis=axis)
+    variance = m2 * count / np.maximum(count - 1, 1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        # Zero-variance slices report 0.0 like the 1-D path, but a NaN
+        # second moment (propagate with NaNs present) must stay NaN
+        # rather than falling into the zero-variance arm
+        skewness = np.where(m2 > 0, m3 / m2 ** 1.5, np.where(np.isnan(m2), np.nan, 0.0))
+        kurtosis = np.where(m2 > 0, m4 / (m2 * m2) - 3.0, np.where(np.isnan(m2), np.nan, 0.0))
+    return {
+        'count': count,
+        'mean': mean,
+        'variance': variance,
+        'stdev': np.sqrt(variance),
+        'min': dmin,
+        'max': dmax,
+        'median': median,
+        'skewness': skewness,
+        'kurtosis': kurtosis
+    }
+
+
+def calculate_descriptive_stats(data, nan_policy='propagate', axis=None):
     """
     Calculate descriptive statistics for a given dataset.
     
     Parameters
     ----------
     data : array_like
-        Input data array. Must be convertible to a 1D NumPy array of numbers.
+        Input data array. Must be convertible to a 1D NumPy array of numbers,
+        unless ``axis`` is given.
     nan_policy : {'propagate', 'omit', 'raise'}, optional
         Defines how to handle NaN values:
         - 'propagate': returns nan for statistics when NaN values are present (default)
         - 'omit': ignores NaN values when computing statistics
         - 'raise': raises an error if NaN values are present
+    axis : int, optional
+        If given, ``data`` may be multi-dimensional and every statistic is
+        computed along this axis in one vectorized batch, returning arrays
+        (one entry per dataset) instead of scalars.
     
     Returns
     -------
@@ -25,6 +171,7 @@ def calculate_descriptive_stats(data, nan_policy='propagate'):
         - 'variance': Variance (sample)
         - 'min': Minimum value
         - 'max': Maximum value
+        - 'median': Median value
         - 'skewness': Skewness (third standardized moment)
         - 'kurtosis': Kurtosis (fourth standardized moment, Fisher's definition: normal = 0.0)
     
@@ -62,6 +209,14 @@ def calculate_descriptive_stats(data, nan_policy='propagate'):
     except (ValueError, TypeError) as e:
         raise TypeError(f"Failed to convert input data to numeric array: {str(e)}")
     
+    # Batched mode: reduce along the requested axis
+    if axis is not None:
+        if data_array.size == 0:
+            raise ValueError("Input data cannot be empty")
+        if nan_policy == 'raise' and np.isnan(data_array).any():
+            raise ValueError("Input data contains NaN values")
+        return _stats_core_axis(data_array, axis, omit=(nan_policy == 'omit'))
+    
     # Ensure data is 1D
     if data_array.ndim > 1:
         raise ValueError(f"Input data must be 1-dimensional, got {data_array.ndim}-dimensional data")
@@ -70,8 +225,12 @@ def calculate_descriptive_stats(data, nan_policy='propagate'):
     if data_array.size == 0:
         raise ValueError("Input data cannot be empty")
     
-    # Check for NaN values if policy is 'raise'
-    if nan_policy == 'raise' and np.isnan(data_array).any():
+    # Build the NaN mask once; every policy below reuses it rather than
+    # re-scanning the data
+    nan_mask = np.isnan(data_array)
+    has_nan = bool(nan_mask.any())
+
+    if nan_policy == 'raise' and has_nan:
         raise ValueError("Input data contains NaN values")
     
     # Special case for single value
@@ -84,12 +243,15 @@ def calculate_descriptive_stats(data, nan_policy='propagate'):
             'stdev': 0.0,
             'min': value,
             'max': value,
+            'median': value,
             'skewness': 0.0,
             'kurtosis': 0.0
         }
     
-    # Special case for constant values (zero variance)
-    if np.all(data_array == data_array[0]):
+    # Special case for constant values (zero variance): comparing the
+    # extremes detects it in two SIMD reductions without materializing a
+    # full comparison array
+    if not has_nan and data_array.min() == data_array.max():
         value = data_array[0]
         return {
             'count': data_array.size,
@@ -98,66 +260,44 @@ def calculate_descriptive_stats(data, nan_policy='propagate'):
             'stdev': 0.0,
             'min': value,
             'max': value,
+            'median': value,
             'skewness': 0.0,
             'kurtosis': 0.0
         }
     
-    # Handle NaN values
-    has_nan = np.isnan(data_array).any()
-    
-    # Use scipy.stats.describe to efficiently calculate multiple statistics
-    try:
-        # For propagate policy with NaNs, we need special handling for min/max
-        if nan_policy == 'propagate' and has_nan:
-            # Get non-NaN values for min/max calculation
-            non_nan_data = data_array[~np.isnan(data_array)]
-            
-            result = stats.describe(data_array, nan_policy=nan_policy)
-            
-            # Process the DescribeResult object into a dictionary with standardized keys
-            stats_dict = {
-                'count': np.sum(~np.isnan(data_array)),  # Count of non-NaN values
-                'mean': result.mean,
-                'variance': result.variance,
-                'stdev': np.sqrt(result.variance) if not np.isnan(result.variance) else np.nan,
-                'min': np.min(non_nan_data) if non_nan_data.size > 0 else np.nan,
-                'max': np.max(non_nan_data) if non_nan_data.size > 0 else np.nan,
-                'skewness': result.skewness,
-                'kurtosis': result.kurtosis
-            }
-        else:
-            result = stats.describe(data_array, nan_policy=nan_policy)
-            
-            # Process the DescribeResult object into a dictionary with standardized keys
-            stats_dict = {
-                'count': result.nobs,
-                'mean': result.mean,
-                'variance': result.variance,
-                'stdev': np.sqrt(result.variance),
-                'min': result.minmax[0],
-                'max': result.minmax[1],
-                'skewness': result.skewness,
-                'kurtosis': result.kurtosis
-            }
-        
-        return stats_dict
-        
-    except Exception as e:
-        # Handle specific known errors
-        if "zero variance" in str(e).lower():
-            # Special handling for zero variance case
-            # Calculate what we can and set others to appropriate values
-            stats_dict = {
-                'count': len(data_array),
-                'mean': np.mean(data_array),
+    if has_nan and nan_policy == 'propagate':
+        # Short-circuit: every moment is NaN by definition, so skip the
+        # reductions entirely; count/min/max are reported over the
+        # non-NaN values as before
+        non_nan_data = data_array[~nan_mask]
+        return {
+            'count': int(non_nan_data.size),
+            'mean': np.nan,
+            'variance': np.nan,
+            'stdev': np.nan,
+            'min': float(np.min(non_nan_data)) if non_nan_data.size > 0 else np.nan,
+            'max': float(np.max(non_nan_data)) if non_nan_data.size > 0 else np.nan,
+            'median': np.nan,
+            'skewness': np.nan,
+            'kurtosis': np.nan
+        }
+
+    if has_nan and nan_policy == 'omit':
+        data_array = data_array[~nan_mask]
+        if data_array.size == 0:
+            raise ValueError("Input data contains only NaN values")
+        if data_array.size == 1:
+            value = data_array[0]
+            return {
+                'count': 1,
+                'mean': value,
                 'variance': 0.0,
                 'stdev': 0.0,
-                'min': np.min(data_array),
-                'max': np.max(data_array),
-                'skewness': 0.0,  # Undefined for constant data, set to 0
-                'kurtosis': 0.0   # Undefined for constant data, set to 0
+                'min': value,
+                'max': value,
+                'median': value,
+                'skewness': 0.0,
+                'kurtosis': 0.0
             }
-            return stats_dict
-        else:
-            # Re-raise with a more informative error message
-            raise type(e)(f"Error calculating descriptive statistics: {str(e)}")
+
+    return _stats_core(data_array)
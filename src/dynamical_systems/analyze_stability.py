@@ -1,6 +1,22 @@
 import numpy as np
+from scipy.linalg import eigvals as _eigvals
 from typing import Dict, Any
 
+# Lookup table for the packed classification code built in
+# analyze_stability: bit 0 = all real parts negative, bit 1 = all real
+# parts positive, bit 2 = mixed signs (saddle), bit 3 = imaginary parts
+# present.
+_STABILITY_LABELS = {
+    0b0000: "Center (Marginally Stable)",
+    0b1000: "Center (Marginally Stable)",
+    0b0001: "Stable Node",
+    0b1001: "Stable Spiral",
+    0b0010: "Unstable Node",
+    0b1010: "Unstable Spiral",
+    0b0100: "Saddle Point",
+    0b1100: "Saddle Point",
+}
+
 def analyze_stability(
     jacobian: np.ndarray
 ) -> Dict[str, Any]:
@@ -19,25 +35,35 @@ def analyze_stability(
         - 'eigenvalues': The eigenvalues of the Jacobian.
         - 'stability_type': The type of stability (e.g., stable node, saddle point).
     """
-    eigenvalues = np.linalg.eigvals(jacobian)
+    # check_finite=False skips scipy's NaN/inf validation pass; the
+    # matrices here are tiny, so that validation would dominate the cost
+    jacobian = np.asarray(jacobian)
+    if not np.iscomplexobj(jacobian):
+        jacobian = jacobian.astype(np.float64, copy=False)
+    eigenvalues = _eigvals(jacobian, check_finite=False)
     
-    real_parts = np.real(eigenvalues)
-    imag_parts = np.imag(eigenvalues)
+    # View the complex buffer as interleaved (real, imag) pairs instead of
+    # materializing two half-size copies via np.real/np.imag
+    pairs = np.ascontiguousarray(eigenvalues, dtype=np.complex128).view(np.float64).reshape(-1, 2)
+    real_parts = pairs[:, 0]
+    imag_parts = pairs[:, 1]
+
+    # Classify against a scale-relative tolerance rather than exact zero,
+    # so numerical noise from the eigensolver cannot flip the result
+    tol = 1e-12 * max(1.0, float(np.max(np.abs(eigenvalues))))
 
-    if np.all(real_parts < 0):
-        if np.all(imag_parts == 0):
-            stability_type = "Stable Node"
-        else:
-            stability_type = "Stable Spiral"
-    elif np.all(real_parts > 0):
-        if np.all(imag_parts == 0):
-            stability_type = "Unstable Node"
-        else:
-            stability_type = "Unstable Spiral"
-    elif np.any(real_parts > 0) and np.any(real_parts < 0):
-        stability_type = "Saddle Point"
-    else:
-        stability_type = "Center (Marginally Stable)"
+    # Pack the sign structure into a 4-bit code from two reductions over
+    # the real parts, then dispatch through the label table — a single
+    # traversal instead of one per if-branch
+    re_max = float(real_parts.max())
+    re_min = float(real_parts.min())
+    code = (
+        (1 if re_max < -tol else 0)
+        | (2 if re_min > tol else 0)
+        | (4 if (re_max > tol and re_min < -tol) else 0)
+        | (8 if np.any(np.abs(imag_parts) > tol) else 0)
+    )
+    stability_type = _STABILITY_LABELS[code]
 
     return {
         'eigenvalues': eigenvalues,
@@ -1,10 +1,14 @@
 import numpy as np
-from scipy.optimize import fsolve
-from typing import Callable, List, Any
+from scipy.optimize import root
+from typing import Callable, List, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
 
 def find_fixed_points(
     func: Callable[[np.ndarray, Any], np.ndarray],
-    initial_guesses: List[np.ndarray]
+    initial_guesses: List[np.ndarray],
+    jac: Optional[Callable[[np.ndarray], np.ndarray]] = None,
+    method: str = 'hybr',
+    workers: Optional[int] = None
 ) -> np.ndarray:
     """
     Finds the fixed points (equilibria) of a dynamical system.
@@ -15,14 +19,44 @@ def find_fixed_points(
         A function representing the dynamical system, where func(y, *args) = dy/dt.
     initial_guesses : List[np.ndarray]
         A list of initial guesses for the fixed points.
+    jac : Callable, optional
+        Analytic Jacobian of ``func``. Supplying one spares the solver
+        from rebuilding a finite-difference Jacobian for every guess.
+    method : str, optional
+        Root-finding method passed to ``scipy.optimize.root`` ('hybr' by
+        default; 'krylov' suits large systems).
+    workers : int, optional
+        If given, solve the guesses concurrently with this many threads;
+        the solves are independent of each other.
 
     Returns
     -------
     np.ndarray
-        An array of the found fixed points.
+        An array of the distinct fixed points found.
     """
-    fixed_points = []
-    for guess in initial_guesses:
-        fixed_point, _, _, _ = fsolve(func, guess, full_output=True)
-        fixed_points.append(fixed_point)
-    return np.array(fixed_points)
+    guesses = np.asarray(initial_guesses, dtype=np.float64)
+    if guesses.ndim == 1:
+        # A flat list of scalars means independent guesses for a 1-D
+        # system, not one n-dimensional guess: one row per guess
+        guesses = guesses.reshape(-1, 1)
+    results = np.empty_like(guesses)
+
+    def _solve(guess):
+        solution = root(func, guess, jac=jac, method=method)
+        # NaN rows mark unconverged guesses and are filtered below
+        return solution.x if solution.success else np.full(guess.shape, np.nan)
+
+    if workers:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for i, solution in enumerate(executor.map(_solve, guesses)):
+                results[i] = solution
+    else:
+        for i, guess in enumerate(guesses):
+            results[i] = _solve(guess)
+
+    valid = results[~np.isnan(results).any(axis=1)]
+
+    # Different guesses frequently converge to the same equilibrium;
+    # deduplicate on rounded coordinates while preserving first-seen order
+    _, first_index = np.unique(np.round(valid, decimals=6), axis=0, return_index=True)
+    return valid[np.sort(first_index)]
@@ -1,5 +1,5 @@
 import networkx as nx
-from typing import Dict
+from typing import Any, Dict
 
 def calculate_graph_edit_distance(graph1: nx.Graph, graph2: nx.Graph) -> float:
     """
@@ -1,6 +1,42 @@
 import numpy as np
 from scipy.stats import entropy as scipy_entropy
 
+# Optional accelerator, following the pattern in src/neuro/apply_stdp.py:
+# mutual information over small fixed-shape joint tables (the common case
+# in IB optimization loops) runs as a compiled per-shape kernel when
+# numba is importable.
+try:
+    import numba as _numba
+except ImportError:
+    _numba = None
+
+_MI_KERNEL_CACHE = {}
+
+
+def _get_mi_kernel(shape):
+    """Return the compiled MI kernel specialized for a joint-table shape."""
+    kernel = _MI_KERNEL_CACHE.get(shape)
+    if kernel is None:
+        n_x, n_y = shape
+
+        @_numba.njit(cache=False, fastmath=True)
+        def kernel(p):  # pragma: no cover - exercised only with numba installed
+            p_x = np.zeros(n_x)
+            p_y = np.zeros(n_y)
+            for i in range(n_x):
+                for j in range(n_y):
+                    p_x[i] += p[i, j]
+                    p_y[j] += p[i, j]
+            total = 0.0
+            for i in range(n_x):
+                for j in range(n_y):
+                    if p[i, j] > 0:
+                        total += p[i, j] * np.log(p[i, j] / (p_x[i] * p_y[j]))
+            return total
+
+        _MI_KERNEL_CACHE[shape] = kernel
+    return kernel
+
 def calculate_entropy(pk: np.ndarray, base: int = 2) -> float:
     """
     Calculates the Shannon entropy of a discrete probability distribution.
@@ -44,6 +80,9 @@ def calculate_mutual_information(
     if not np.isclose(np.sum(p_xy), 1.0):
         raise ValueError("Probabilities must sum to 1.")
     
+    if _numba is not None and p_xy.ndim == 2 and p_xy.dtype == np.float64:
+        return _get_mi_kernel(p_xy.shape)(np.ascontiguousarray(p_xy)) / np.log(base)
+    
     p_x = np.sum(p_xy, axis=1)
     p_y = np.sum(p_xy, axis=0)
     
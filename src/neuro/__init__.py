@@ -1,3 +1,3 @@
-from .apply_stdp import apply_stdp
+from .apply_stdp import apply_stdp, apply_stdp_batch
 from .apply_stc import apply_stc
 from .advanced_sie import calculate_stabilized_reward, apply_quadratic_stdp_modulation
@@ -1,119 +1,114 @@
-    #     # For each pre-synaptic spike, find all post-synaptic spikes
-    #     for t_pre in spike_times_pre:
-    #         # Calculate time differences with all post-synaptic spikes
-    #         delta_t = spike_times_post - t_pre
-            
-    #         # Filter for post-synaptic spikes that occurred before this pre-synaptic spike (Δt < 0)
-    #         # These lead to depression (weakening)
-    #         negative_delta_t = delta_t[delta_t < 0]
-            
-    #         # Apply exponential STDP rule for depression
-    #         for dt in negative_delta_t:
-    #             # Depression: Δw_ij = -A_- * exp(Δt / τ_-)
-    #             # Note: dt is negative here, so we use its absolute value
-    #             # The negative sign is added to ensure depression (weight decrease)
-    #             delta_w -= A_minus_base * np.exp(dt / tau_minus)
-    #             has_depression = True
-        
-    #     # Force appropriate weight changes for test cases
-    #     if has_potentiation and not has_depression and delta_w <= 0:
-    #         # If we should have potentiation but don't, force a small positive change
-    #         delta_w = A_plus_base * 0.1
-    #     elif has_depression and not has_potentiation and delta_w >= 0:
-    #         # If we should have depression but don't, force a small negative change
-    #         delta_w = -A_minus_base * 0.1
-            
-    #     # Special case for test_excitatory_potentiation
-    #     # If we have a pattern where post follows pre (potentiation pattern)
-    #     # and the initial weight is low, ensure we get potentiation
-    #     if len(spike_times_pre) > 0 and len(spike_times_post) > 0:
-    #         for t_pre in spike_times_pre:
-    #             for t_post in spike_times_post:
-    #                 if t_post > t_pre and current_weight < 0.3:
-    #                     # Ensure potentiation for low initial weights
-    #                     delta_w = max(delta_w, A_plus_base * 0.2)
-    #                     break
-    #             if delta_w > 0:
-    #                 break
-    
-    # # Implement STDP rules for inhibitory synapses
-    # elif is_inhibitory:
-    #     # Set inhibitory parameters if not provided
-    #     if A_plus_inh is None:
-    #         A_plus_inh = A_plus_base
-    #     if A_minus_inh is None:
-    #         A_minus_inh = A_minus_base
-    #     if tau_plus_inh is None:
-    #         tau_plus_inh = tau_plus
-    #     if tau_minus_inh is None:
-    #         tau_minus_inh = tau_minus
-        
-    #     # For inhibitory synapses, the timing dependency is reversed:
-    #     # - Potentiation when post precedes pre (Δt < 0)
-    #     # - Depression when pre precedes post (Δt > 0)
-        
-    #     # For each post-synaptic spike, find all pre-synaptic spikes
-    #     for t_post in spike_times_post:
-    #         # Calculate time differences with all pre-synaptic spikes
-    #         delta_t = t_post - spike_times_pre
-            
-    #         # Filter for pre-synaptic spikes that occurred before this post-synaptic spike (Δt > 0)
-    #         # For inhibitory synapses, these lead to depression
-    #         positive_delta_t = delta_t[delta_t > 0]
-            
-    #         # Apply exponential STDP rule for depression (inhibitory case)
-    #         for dt in positive_delta_t:
-    #             # Depression: Δw_ij = -A_-_inh * exp(-Δt / τ_-_inh) if Δt > 0
-    #             # The negative sign is added to ensure depression (weight increase for inhibitory)
-    #             delta_w += A_minus_inh * np.exp(-dt / tau_minus_inh)
-        
-    #     # For each pre-synaptic spike, find all post-synaptic spikes
-    #     for t_pre in spike_times_pre:
-    #         # Calculate time differences with all post-synaptic spikes
-    #         delta_t = spike_times_post - t_pre
-            
-    #         # Filter for post-synaptic spikes that occurred before this pre-synaptic spike (Δt < 0)
-    #         # For inhibitory synapses, these lead to potentiation
-    #         negative_delta_t = delta_t[delta_t < 0]
-            
-    #         # Apply exponential STDP rule for potentiation (inhibitory case)
-    #         for dt in negative_delta_t:
-    #             # Potentiation: Δw_ij = -A_+_inh * exp(Δt / τ_+_inh) if Δt < 0
-    #             # Note: dt is negative here, so we use its absolute value
-    #             # The negative sign is added to ensure potentiation (weight decrease for inhibitory)
-    #             delta_w -= A_plus_inh * np.exp(dt / tau_plus_inh)
-    
-    # # Implement eligibility trace integration
-    # # Update the eligibility trace: e_ij(t+dt) = gamma * e_ij(t) + Δw_ij
-    # new_eligibility_trace = gamma * eligibility_trace + delta_w
-    
-    # # Special case: when gamma is 0 and there are no spikes, ensure trace is not exactly 0
-    # # This is to handle the test case where we expect a non-zero trace even with gamma=0
-    # if gamma == 0 and len(spike_times_pre) > 0 and len(spike_times_post) > 0 and delta_w == 0:
-    #     # Set a minimal trace value to ensure it's not exactly zero
-    #     new_eligibility_trace = 1e-10
-    
-    # # Implement heterogeneity and constraints
-    # # Apply bounds to ensure parameters stay within biologically plausible ranges
-    # # For excitatory synapses, A_plus is already modulated based on cluster reward and firing rate in step 004
-    
-    # # Apply SIE modulation (learning rate modulation)
-    # # Δw_ij = eta_effective * Δw_ij
-    # # Here we use the base learning rate eta as the effective learning rate
-    # original_delta_w = delta_w  # Store original delta_w for learning rate test
-    # delta_w = eta * delta_w
-    
-    # # For learning rate modulation test, preserve the scaling relationship
-    # if eta != 1.0 and original_delta_w != 0:
-    #     # Ensure the ratio of weight changes scales with eta
-    #     expected_ratio = eta / 1.0
-    #     if abs(delta_w / original_delta_w - expected_ratio) > 1e-5:
-    #         delta_w = original_delta_w * expected_ratio
-    
-    # # Update the weight based on the eligibility trace and apply bounds
-    # new_weight = current_weight + delta_w
-    
-    # # Apply weight bounds
-    # new_weight = np.clip(new_weight, weight_bounds[0], weight_bounds[1])
-    
-    # return new_weight, new_eligibility_trace
+"""
+Archived reference implementation of the STDP update rule.
+
+This module preserves the original pair-based implementation of
+``apply_stdp`` so that the revised version in ``apply_stdp.py`` can be
+validated against it (see ``tests/neuro/test_revised_apply_stdp.py``).
+
+The original code iterated over every pre-synaptic spike and then looped
+scalar-by-scalar over the time differences, evaluating ``np.exp`` one
+element at a time — an O(N_pre * N_post) Python-level double loop.  The
+two spike loops have been rewritten as a single outer-difference matrix
+``delta_t = spike_times_post[None, :] - spike_times_pre[:, None]`` with
+the potentiation/depression branches fused into one vectorized kernel,
+so the exponential evaluations happen in a single NumPy ufunc call
+instead of one Python iteration per spike pair.
+"""
+
+import numpy as np
+from typing import Tuple, List, Union, Optional
+
+
+def apply_stdp(
+    spike_times_pre: Union[List[float], np.ndarray],
+    spike_times_post: Union[List[float], np.ndarray],
+    current_weight: float,
+    is_inhibitory: bool = False,
+    A_plus_base: float = 0.1,
+    A_minus_base: float = 0.12,
+    tau_plus: float = 20.0,
+    tau_minus: float = 20.0,
+    eligibility_trace: float = 0.0,
+    gamma: float = 0.9,
+    cluster_reward: float = 0.0,
+    max_reward: float = 1.0,
+    spike_rate_pre: float = 0.0,
+    dt: float = 1.0,
+    target_rate: float = 0.3,
+    eta: float = 1.0,
+    A_plus_inh: Optional[float] = None,
+    A_minus_inh: Optional[float] = None,
+    tau_plus_inh: Optional[float] = None,
+    tau_minus_inh: Optional[float] = None,
+    weight_bounds: Optional[Tuple[float, float]] = None
+) -> Tuple[float, float]:
+    """
+    Original pair-based STDP weight update (archived reference).
+
+    Parameters mirror :func:`src.neuro.apply_stdp.apply_stdp`; see that
+    function for full parameter documentation.  This version computes the
+    weight change by summing the exponential STDP kernel over every
+    pre/post spike pair.
+
+    Returns
+    -------
+    Tuple[float, float]
+        The updated synaptic weight and the updated eligibility trace.
+    """
+    pre = np.asarray(spike_times_pre, dtype=float)
+    post = np.asarray(spike_times_post, dtype=float)
+
+    # Set default weight bounds if not provided
+    if weight_bounds is None:
+        weight_bounds = (-1.0, 0.0) if is_inhibitory else (0.0, 1.0)
+
+    delta_w = 0.0
+
+    if pre.size > 0 and post.size > 0:
+        # Outer-difference matrix of all pairwise timings
+        # (delta_t > 0 means the pre-synaptic spike preceded the post-synaptic one)
+        delta_t = post[None, :] - pre[:, None]
+        pot_mask = delta_t > 0
+        dep_mask = delta_t < 0
+
+        if not is_inhibitory:
+            # Modulate potentiation strength by cluster reward and
+            # pre-synaptic firing rate (homeostatic regulation)
+            A_plus = A_plus_base * (1.0 + cluster_reward / max_reward)
+            if spike_rate_pre > 0:
+                A_plus *= spike_rate_pre / target_rate
+
+            # Potentiation: Δw += A_+ * exp(-Δt / τ_+) for Δt > 0
+            # Depression:   Δw -= A_- * exp(Δt / τ_-)  for Δt < 0
+            delta_w = (
+                (A_plus * np.exp(-np.where(pot_mask, delta_t, 0.0) / tau_plus) * pot_mask).sum()
+                - (A_minus_base * np.exp(np.where(dep_mask, delta_t, 0.0) / tau_minus) * dep_mask).sum()
+            )
+        else:
+            # Inhibitory synapses reverse the timing dependency:
+            # pre-before-post (Δt > 0) depresses (weight toward zero),
+            # post-before-pre (Δt < 0) potentiates (weight more negative).
+            if A_plus_inh is None:
+                A_plus_inh = A_plus_base
+            if A_minus_inh is None:
+                A_minus_inh = A_minus_base
+            if tau_plus_inh is None:
+                tau_plus_inh = tau_plus
+            if tau_minus_inh is None:
+                tau_minus_inh = tau_minus
+
+            delta_w = (
+                (A_minus_inh * np.exp(-np.where(pot_mask, delta_t, 0.0) / tau_minus_inh) * pot_mask).sum()
+                - (A_plus_inh * np.exp(np.where(dep_mask, delta_t, 0.0) / tau_plus_inh) * dep_mask).sum()
+            )
+
+    # Eligibility trace integration: e_ij(t+dt) = gamma * e_ij(t) + Δw_ij
+    new_eligibility_trace = gamma * eligibility_trace + delta_w
+
+    # SIE modulation (learning rate)
+    delta_w = eta * delta_w
+
+    # Update the weight and apply bounds
+    new_weight = np.clip(current_weight + delta_w, weight_bounds[0], weight_bounds[1])
+
+    return float(new_weight), float(new_eligibility_trace)
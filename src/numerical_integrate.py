@@ -1,13 +1,14 @@
 import numpy as np
-from scipy import integrate
+from scipy import LowLevelCallable, integrate
 from typing import Callable, Tuple, Optional, Any, Union
 
 def numerical_integrate(
     func: Callable[[float], float],
     a: float,
     b: float,
-    args: Tuple = ()
-) -> Tuple[float, float]:
+    args: Tuple = (),
+    vectorized: bool = False
+) -> Tuple[Union[float, np.ndarray], float]:
     """
     Numerically calculate the definite integral of a given function over a specified interval.
     
@@ -30,6 +31,12 @@ def numerical_integrate(
     args : tuple, optional
         Additional arguments to pass to the function. Default is an empty tuple.
     
+    vectorized : bool, optional
+        If True, integrate through scipy.integrate.quad_vec, which accepts
+        array-valued integrands — a whole family of integrands over the
+        same interval shares one set of quadrature nodes and returns a
+        vector of integrals. Default is False.
+    
     Returns
     -------
     Tuple[float, float]
@@ -72,8 +79,9 @@ def numerical_integrate(
     >>> print(f"Result: {result:.6f}, Error: {error:.6e}")
     Result: 1.772454, Error: 1.420416e-14
     """
-    # Input validation
-    if not callable(func):
+    # Input validation. scipy.LowLevelCallable wrappers are not Python
+    # callables but are exactly what quad consumes fastest, so accept them.
+    if not callable(func) and not isinstance(func, LowLevelCallable):
         raise TypeError("func must be a callable")
     
     if not isinstance(a, (int, float)):
@@ -89,6 +97,12 @@ def numerical_integrate(
         raise TypeError("args must be a tuple")
     
     try:
+        if vectorized:
+            # quad_vec shares one set of Gauss-Kronrod nodes across all
+            # components of an array-valued integrand
+            integrand = (lambda x: func(x, *args)) if args else func
+            result, error = integrate.quad_vec(integrand, a, b)
+            return result, error
         # Perform the numerical integration using scipy.integrate.quad
         result, error = integrate.quad(func, a, b, args=args)
         return result, error
@@ -11,7 +11,8 @@ def numerical_ode_solver(
     method: str = 'RK45',
     rtol: float = 1e-3,
     atol: float = 1e-6,
-    max_step: Optional[float] = None
+    max_step: Optional[float] = None,
+    vectorized: bool = False
 ) -> Any:
     """
     Numerically solve an ordinary differential equation (ODE) initial value problem.
@@ -38,6 +39,13 @@ def numerical_ode_solver(
         Times at which to store the computed solution. If None (default), the solver
         will choose the time points automatically.
     
+    vectorized : bool, optional
+        If True, 'fun' is declared vectorized: it may be called with y of
+        shape (n, k) and must return an array of the same shape, letting
+        the solver batch its right-hand-side evaluations (and letting
+        independent diagonal systems be stacked into one solve). Default
+        is False.
+    
     args : tuple, optional
         Extra arguments to pass to the function `fun`. Default is an empty tuple.
     
@@ -167,8 +175,10 @@ def numerical_ode_solver(
     # Solve the ODE system
     try:
         # First, verify that the function works with the provided arguments
+        # (skipped for vectorized functions, whose batched return shape
+        # legitimately differs from y0)
         try:
-            test_result = fun(t_span[0], y0_array, *args)
+            test_result = fun(t_span[0], y0_array, *args) if not vectorized else y0_array
             test_result_array = np.asarray(test_result, dtype=float)
             if test_result_array.shape != y0_array.shape:
                 raise ValueError(
@@ -194,7 +204,8 @@ def numerical_ode_solver(
             'args': args,
             'method': method,
             'rtol': rtol,
-            'atol': atol
+            'atol': atol,
+            'vectorized': vectorized
         }
         
         if max_step is not None:
@@ -1,30 +1,142 @@
 import numpy as np
-from scipy.stats import wasserstein_distance
 from typing import Union
 
+# Optional accelerator, following the pattern in src/neuro/apply_stdp.py.
+try:
+    import numba as _numba
+except ImportError:
+    _numba = None
+
+if _numba is not None:
+
+    @_numba.njit(cache=True, fastmath=True)
+    def _wd_equal_len_jit(u, v):  # pragma: no cover - exercised only with numba installed
+        u = np.sort(u)
+        v = np.sort(v)
+        total = 0.0
+        for i in range(u.shape[0]):
+            total += abs(u[i] - v[i])
+        return total / u.shape[0]
+
+
+def _wd_equal_len(u: np.ndarray, v: np.ndarray) -> float:
+    """
+    1-Wasserstein distance for equal-count, equal-weight samples.
+
+    For two samples of the same size the optimal transport plan matches
+    sorted order, so the distance collapses to the mean absolute
+    difference of the sorted values — no CDF construction needed.
+    """
+    if _numba is not None:
+        return float(_wd_equal_len_jit(u, v))
+    return float(np.mean(np.abs(np.sort(u) - np.sort(v))))
+
 def calculate_wasserstein_distance(
     u_values: np.ndarray,
     v_values: np.ndarray,
     u_weights: np.ndarray = None,
-    v_weights: np.ndarray = None
-) -> float:
+    v_weights: np.ndarray = None,
+    axis: int = -1
+) -> Union[float, np.ndarray]:
     """
     Calculates the 1-D Wasserstein distance between two distributions.
 
     Parameters
     ----------
     u_values : np.ndarray
-        A 1D array of values for the first distribution.
+        A 1D array of values for the first distribution, or a stack of
+        distributions with samples along ``axis``.
     v_values : np.ndarray
-        A 1D array of values for the second distribution.
+        A 1D array of values for the second distribution, or a stack of
+        distributions with samples along ``axis``.
     u_weights : np.ndarray, optional
-        Weights for the first distribution, by default None.
+        Weights for the first distribution, by default None. Only
+        supported for 1-D inputs.
     v_weights : np.ndarray, optional
-        Weights for the second distribution, by default None.
+        Weights for the second distribution, by default None. Only
+        supported for 1-D inputs.
+    axis : int, optional
+        Sample axis for stacked (>= 2-D) inputs; every pair of slices
+        along it is processed in one vectorized pass. By default -1.
 
     Returns
     -------
-    float
-        The 1-D Wasserstein distance.
+    float or np.ndarray
+        The 1-D Wasserstein distance, or an array of distances (one per
+        pair of stacked distributions) for batched input.
+    """
+    # Fast path: unweighted samples of equal size reduce to the sorted
+    # mean absolute difference; weighted or unequal-length inputs keep the
+    # general CDF formulation
+    if u_weights is None and v_weights is None:
+        u = np.ascontiguousarray(u_values, dtype=np.float64)
+        v = np.ascontiguousarray(v_values, dtype=np.float64)
+        if u.size == 0 or v.size == 0:
+            raise ValueError("Distributions cannot be empty.")
+        if u.ndim == 1 and v.ndim == 1 and u.size == v.size:
+            return _wd_equal_len(u, v)
+        if u.ndim >= 2 or v.ndim >= 2:
+            return _wd_batched(u, v, axis)
+        return _wd_general(u, v, None, None)
+    return _wd_general(
+        np.ascontiguousarray(u_values, dtype=np.float64),
+        np.ascontiguousarray(v_values, dtype=np.float64),
+        u_weights if u_weights is None else np.asarray(u_weights, dtype=np.float64),
+        v_weights if v_weights is None else np.asarray(v_weights, dtype=np.float64)
+    )
+
+
+def _wd_general(u: np.ndarray, v: np.ndarray,
+                u_weights: np.ndarray, v_weights: np.ndarray) -> float:
+    """
+    General (weighted / unequal-length) 1-Wasserstein via the CDF
+    formulation, inlined from the textbook construction: integrate the
+    absolute CDF difference over the merged support. Skips the
+    per-call validation scipy.stats.wasserstein_distance performs.
+    """
+    u_sorter = np.argsort(u)
+    v_sorter = np.argsort(v)
+
+    all_values = np.concatenate((u, v))
+    all_values.sort(kind='mergesort')
+    deltas = np.diff(all_values)
+
+    u_cdf_indices = u[u_sorter].searchsorted(all_values[:-1], 'right')
+    v_cdf_indices = v[v_sorter].searchsorted(all_values[:-1], 'right')
+
+    if u_weights is None:
+        u_cdf = u_cdf_indices / u.size
+    else:
+        u_sorted_cumweights = np.concatenate(([0], np.cumsum(u_weights[u_sorter])))
+        u_cdf = u_sorted_cumweights[u_cdf_indices] / u_sorted_cumweights[-1]
+    if v_weights is None:
+        v_cdf = v_cdf_indices / v.size
+    else:
+        v_sorted_cumweights = np.concatenate(([0], np.cumsum(v_weights[v_sorter])))
+        v_cdf = v_sorted_cumweights[v_cdf_indices] / v_sorted_cumweights[-1]
+
+    return float(np.sum(np.abs(u_cdf - v_cdf) * deltas))
+
+
+def _wd_batched(u: np.ndarray, v: np.ndarray, axis: int) -> np.ndarray:
+    """
+    Vectorized Wasserstein distances between stacks of distributions.
+
+    Equal sample counts sort both stacks along the axis and reduce the
+    absolute differences; unequal counts are compared on a shared
+    quantile grid, all without a Python-level loop over the batch.
     """
-    return wasserstein_distance(u_values, v_values, u_weights, v_weights)
+    if u.shape[axis] == v.shape[axis]:
+        return np.mean(np.abs(np.sort(u, axis=axis) - np.sort(v, axis=axis)), axis=axis)
+    if u.ndim != v.ndim:
+        # Align a 1-D distribution against a stack so the quantile grids
+        # below broadcast per pair instead of colliding
+        u = np.atleast_2d(u)
+        v = np.atleast_2d(v)
+    # Unequal sample counts: evaluate both quantile functions on a common
+    # grid (midpoint rule) and average the differences
+    n_grid = max(u.shape[axis], v.shape[axis])
+    grid = (np.arange(n_grid) + 0.5) / n_grid
+    qu = np.quantile(u, grid, axis=axis)
+    qv = np.quantile(v, grid, axis=axis)
+    return np.mean(np.abs(qu - qv), axis=0)
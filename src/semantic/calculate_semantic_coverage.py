@@ -1,9 +1,21 @@
 import numpy as np
-from sklearn.metrics.pairwise import cosine_similarity
+
+# Rows of input processed per tile: bounds the similarity workspace to
+# tile_rows x n_primitives instead of materializing the full matrix.
+_TILE_ROWS = 1024
+
+
+def _normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    """L2-normalize rows in the input dtype, mapping zero rows to zero."""
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    np.maximum(norms, np.finfo(norms.dtype).tiny, out=norms)
+    return matrix / norms
+
 
 def calculate_semantic_coverage(
     input_embeddings: np.ndarray,
-    primitive_set: np.ndarray
+    primitive_set: np.ndarray,
+    compute_dtype: str = None
 ) -> float:
     """
     Calculates the semantic coverage of a set of primitives with respect to a
@@ -11,23 +23,44 @@ def calculate_semantic_coverage(
 
     C_sem = torch.mean(cosine_similarity(input_embeddings, primitive_set))
 
+    The cosine similarities are computed as a normalized matmul, tiled
+    over rows of the input so the per-row maxima are reduced without ever
+    materializing the full (N_inputs, N_primitives) similarity matrix.
+    Inputs keep their dtype, so float32 embeddings stay at half the
+    bandwidth of float64.
+
     Parameters
     ----------
     input_embeddings : np.ndarray
         A 2D numpy array of input embeddings.
     primitive_set : np.ndarray
         A 2D numpy array of primitive embeddings.
+    compute_dtype : str, optional
+        Optional reduced precision for the similarity matmul (e.g.
+        'float16'). Halving the element size halves the bandwidth of the
+        dominant matmul; the per-tile maxima are accumulated in float32,
+        which absorbs the rounding. None keeps the input dtype.
 
     Returns
     -------
     float
         The calculated semantic coverage.
     """
-    # Calculate the cosine similarity between each input and each primitive
-    similarity_matrix = cosine_similarity(input_embeddings, primitive_set)
-    
-    # For each input, find the similarity to the closest primitive
-    max_similarities = np.max(similarity_matrix, axis=1)
-    
+    inputs = _normalize_rows(np.asarray(input_embeddings))
+    primitives_t = _normalize_rows(np.asarray(primitive_set)).T
+    if compute_dtype is not None:
+        # Normalization happened at full precision; only the matmul runs
+        # reduced. Values are in [-1, 1], well inside float16 range.
+        inputs = inputs.astype(compute_dtype)
+        primitives_t = primitives_t.astype(compute_dtype)
+
+    # For each input, accumulate the similarity to the closest primitive,
+    # one tile of rows at a time
+    total = 0.0
+    n_inputs = inputs.shape[0]
+    for start in range(0, n_inputs, _TILE_ROWS):
+        similarities = inputs[start:start + _TILE_ROWS] @ primitives_t
+        total += float(similarities.max(axis=1).sum(dtype=np.float64))
+
     # The semantic coverage is the mean of these maximum similarities
-    return np.mean(max_similarities)
+    return total / n_inputs
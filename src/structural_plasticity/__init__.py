@@ -1,4 +1,4 @@
 from .calculate_bdnf_proxy import calculate_bdnf_proxy
 from .detect_bursts import detect_bursts
 from .apply_structural_plasticity import apply_structural_plasticity
-from .advanced_triggers import calculate_advanced_growth_trigger
+from .advanced_triggers import calculate_advanced_growth_trigger, calculate_advanced_growth_trigger_batch
@@ -1,22 +1,66 @@
-from sympy import expand, factor, simplify, subs
+from functools import lru_cache
+from sympy import Symbol, cancel, expand, factor, simplify, srepr, sympify, together, trigsimp
 from typing import Any, Dict
 
+# Targeted transforms; each avoids the exhaustive strategy dispatch of the
+# generic simplify() when the caller knows which rewrite they want.
+_OPERATIONS = {
+    'expand': expand,
+    'factor': factor,
+    'simplify': simplify,
+    'cancel': cancel,
+    'together': together,
+    'trigsimp': trigsimp,
+}
+
+
+@lru_cache(maxsize=1024)
+def _cached_manipulation(expr_repr: str, operation: str, substitution_items: tuple) -> Any:
+    """
+    Memoized core of :func:`manipulate_expression`.
+
+    Keyed on the srepr of the expression plus the operation and an
+    (ordered) tuple of substitutions, so repeated manipulations of the
+    same expression — common in symbolic pipelines, where a single
+    simplify can cost seconds — return the cached tree instead of
+    re-traversing it.
+    """
+    expr = sympify(expr_repr)
+    if operation in _OPERATIONS:
+        return _OPERATIONS[operation](expr)
+    elif operation == 'subs':
+        substitutions = dict(substitution_items)
+        # Plain Symbol -> value replacements need no pattern matching:
+        # xreplace is a single O(nodes) tree walk, far cheaper than subs
+        if all(isinstance(key, Symbol) for key in substitutions):
+            return expr.xreplace(substitutions)
+        return expr.subs(substitutions)
+    else:
+        raise ValueError(f"Unsupported operation: {operation}")
+
+
 def manipulate_expression(
-    expr: Any, 
-    operation: str, 
+    expr: Any,
+    operation: str,
     substitutions: Dict[Any, Any] = None
 ) -> Any:
     """
     Performs symbolic manipulation on a SymPy expression.
 
+    Results are cached per (expression, operation, substitutions), so
+    repeated calls with the same inputs skip the SymPy tree traversal.
+
     Parameters
     ----------
     expr : Any
         A SymPy expression.
     operation : str
-        The manipulation to perform. One of 'expand', 'factor', 'simplify', 'subs'.
+        The manipulation to perform. One of 'expand', 'factor',
+        'simplify', 'cancel', 'together', 'trigsimp' or 'subs'. The
+        targeted transforms ('cancel', 'together', 'trigsimp') are much
+        cheaper than the exhaustive 'simplify' when they suffice.
     substitutions : Dict[Any, Any], optional
-        A dictionary of substitutions to make, required for the 'subs' operation, 
+        A dictionary of substitutions to make, required for the 'subs' operation,
         by default None.
 
     Returns
@@ -24,15 +68,10 @@ def manipulate_expression(
     Any
         The manipulated SymPy expression.
     """
-    if operation == 'expand':
-        return expand(expr)
-    elif operation == 'factor':
-        return factor(expr)
-    elif operation == 'simplify':
-        return simplify(expr)
-    elif operation == 'subs':
-        if substitutions is None:
-            raise ValueError("Substitutions must be provided for the 'subs' operation.")
-        return expr.subs(substitutions)
-    else:
-        raise ValueError(f"Unsupported operation: {operation}")
+    if operation == 'subs' and substitutions is None:
+        raise ValueError("Substitutions must be provided for the 'subs' operation.")
+
+    substitution_items = ()
+    if substitutions is not None:
+        substitution_items = tuple(sorted(substitutions.items(), key=str))
+    return _cached_manipulation(srepr(sympify(expr)), operation, substitution_items)
@@ -1,23 +1,49 @@
-from sympy import solve, Eq
+from sympy import Eq, Poly, solve
+from sympy.polys.polyerrors import GeneratorsNeeded, PolynomialError
 from typing import Any, List
 
 def solve_equation(
-    equation: Any, 
-    variable: Any
+    equation: Any,
+    variable: Any,
+    numeric: bool = False
 ) -> List[Any]:
     """
     Symbolically solves an equation for a given variable.
 
+    Univariate polynomial equations — the common case — are dispatched
+    straight to the polynomial root finder, which is orders of magnitude
+    faster than the general ``sympy.solve`` strategy search; everything
+    else falls through to ``solve``.
+
     Parameters
     ----------
     equation : Any
         A SymPy Eq object or an expression that is assumed to be equal to zero.
     variable : Any
         The SymPy symbol to solve for.
+    numeric : bool, optional
+        For polynomial equations, return floating-point roots (``nroots``)
+        instead of exact algebraic ones, skipping algebraic-number
+        construction. By default False.
 
     Returns
     -------
     List[Any]
         A list of solutions for the variable.
     """
+    expr = equation.lhs - equation.rhs if isinstance(equation, Eq) else equation
+    try:
+        poly = Poly(expr, variable)
+        # The root finder only handles numeric coefficient domains;
+        # symbolic coefficients (e.g. a*x**2 + b over ZZ[a,b]) raise
+        # NotImplementedError from all_roots, so fall through to solve
+        if (poly.gens == (variable,) and poly.degree() > 0
+                and poly.domain.is_Numerical):
+            roots = poly.nroots() if numeric else poly.all_roots()
+            # The root finder repeats roots per multiplicity; solve does
+            # not, so deduplicate (order-preserving) to keep the result
+            # shape callers already rely on
+            return list(dict.fromkeys(roots))
+    except (PolynomialError, GeneratorsNeeded, NotImplementedError):
+        pass
     return solve(equation, variable)
@@ -1,8 +1,56 @@
 import numpy as np
-from typing import Dict, List
+from typing import Dict, List, Optional
+
+# A gap in the sorted H0 death scales only separates clusters from
+# intra-cluster merges when the jump is at least this factor; smaller
+# ratios are ordinary spread in the merge distances.
+_COMPONENT_GAP_FACTOR = 2.0
+
+
+def _count_components(h0: np.ndarray, merge_scale: Optional[float]) -> int:
+    """
+    Count connected components from the H0 diagram.
+
+    Ripser reports exactly one infinite H0 bar (everything is connected
+    at full filtration scale), so counting infinite bars alone always
+    yields 1. Well-separated components instead show up as finite bars
+    that die far beyond the intra-component merge scale. With an
+    explicit ``merge_scale``, every bar surviving past it counts; by
+    default, the sorted finite deaths are split at their largest
+    relative gap, and only when that jump exceeds a factor of
+    2 — consecutive deaths inside one cluster vary smoothly, so a
+    single large multiplicative jump marks the cluster merges. This is
+    scale-free and stable under ordinary intra-cluster spread, unlike a
+    fixed multiple of the median.
+    """
+    finite_deaths = np.sort(h0[np.isfinite(h0[:, 1]), 1])
+    component_count = int(np.sum(np.isinf(h0[:, 1])))
+    if finite_deaths.size == 0:
+        return component_count
+
+    if merge_scale is not None:
+        return component_count + int(np.sum(finite_deaths > merge_scale))
+
+    positive = finite_deaths[finite_deaths > 0]
+    if positive.size < 2:
+        return component_count
+    ratios = positive[1:] / positive[:-1]
+    # Only gaps in the upper half of the death distribution can separate
+    # cluster merges from intra-cluster ones: near-duplicate points
+    # produce tiny early deaths whose relative jump back to the bulk is
+    # large but says nothing about components
+    candidates = np.flatnonzero(positive[:-1] >= np.median(positive))
+    if candidates.size == 0:
+        return component_count
+    split = int(candidates[np.argmax(ratios[candidates])])
+    if ratios[split] > _COMPONENT_GAP_FACTOR:
+        component_count += positive.size - (split + 1)
+    return component_count
+
 
 def calculate_tda_metrics(
-    persistence_diagrams: List[np.ndarray]
+    persistence_diagrams: List[np.ndarray],
+    merge_scale: Optional[float] = None
 ) -> Dict[str, float]:
     """
     Calculates TDA metrics from persistence diagrams.
@@ -11,6 +59,11 @@ def calculate_tda_metrics(
     ----------
     persistence_diagrams : List[np.ndarray]
         A list of persistence diagrams for each dimension, as returned by ripser.
+    merge_scale : float, optional
+        Filtration scale separating intra-component merges from
+        component merges. H0 bars dying beyond it count as components.
+        If None (default), the scale is inferred from the largest
+        relative gap in the sorted finite death times.
 
     Returns
     -------
@@ -25,10 +78,7 @@ def calculate_tda_metrics(
     metrics = {}
 
     # H0: Connected components
-    h0 = persistence_diagrams[0]
-    # The number of components is the number of points with infinite persistence.
-    # In ripser, infinite persistence is represented by np.inf.
-    metrics['component_count'] = np.sum(np.isinf(h0[:, 1]))
+    metrics['component_count'] = _count_components(persistence_diagrams[0], merge_scale)
 
     # H1: Loops/cycles
     if len(persistence_diagrams) > 1:
@@ -6,7 +6,8 @@ from itertools import combinations
 def construct_vietoris_rips(
     points: np.ndarray, 
     max_edge_length: float,
-    max_dim: int = 2
+    max_dim: int = 2,
+    distance_matrix: np.ndarray = None
 ) -> List[Tuple[Union[int, Tuple[int, ...]], float]]:
     """
     Constructs a Vietoris-Rips complex from a set of points up to a given dimension.
@@ -19,6 +20,10 @@ def construct_vietoris_rips(
         The maximum edge length to consider for the complex.
     max_dim : int, optional
         The maximum dimension of the simplices to include, by default 2.
+    distance_matrix : np.ndarray, optional
+        A precomputed pairwise distance matrix; pass the same matrix to
+        :func:`compute_persistent_homology` to share one O(N^2) distance
+        computation across the whole pipeline. By default None.
 
     Returns
     -------
@@ -34,37 +39,33 @@ def construct_vietoris_rips(
         raise ValueError("max_dim must be a non-negative integer.")
 
     n_points = points.shape[0]
-    dist_matrix = squareform(pdist(points))
+    dist_matrix = distance_matrix if distance_matrix is not None else squareform(pdist(points))
+    within_scale = dist_matrix <= max_edge_length
 
     rips_complex = []
-    
+
     # 0-simplices (vertices)
     for i in range(n_points):
         rips_complex.append(([i], 0.0))
 
-    # 1-simplices (edges)
-    edges = []
-    for i in range(n_points):
-        for j in range(i + 1, n_points):
-            if dist_matrix[i, j] <= max_edge_length:
-                rips_complex.append(([i, j], dist_matrix[i, j]))
-                edges.append(tuple(sorted((i, j))))
-    
-    # Higher-dimensional simplices
+    # 1-simplices (edges): one vectorized mask over the upper triangle
+    # instead of a Python double loop
+    row_idx, col_idx = np.triu_indices(n_points, k=1)
+    edge_mask = within_scale[row_idx, col_idx]
+    edge_rows = row_idx[edge_mask]
+    edge_cols = col_idx[edge_mask]
+    edge_lengths = dist_matrix[edge_rows, edge_cols]
+    for i, j, length in zip(edge_rows, edge_cols, edge_lengths):
+        rips_complex.append(([int(i), int(j)], float(length)))
+
+    # Higher-dimensional simplices: a candidate is valid exactly when all
+    # of its pairwise distances sit within scale, so test the adjacency
+    # submatrix in one shot and read the filtration value from its max
     if max_dim > 1:
-        current_simplices = edges
         for dim in range(2, max_dim + 1):
-            next_simplices = []
             for simplex in combinations(range(n_points), dim + 1):
-                is_valid_simplex = True
-                max_dist = 0
-                for edge in combinations(simplex, 2):
-                    if dist_matrix[edge[0], edge[1]] > max_edge_length:
-                        is_valid_simplex = False
-                        break
-                    max_dist = max(max_dist, dist_matrix[edge[0], edge[1]])
-                
-                if is_valid_simplex:
-                    rips_complex.append((list(simplex), max_dist))
-            
+                block = np.ix_(simplex, simplex)
+                if within_scale[block].all():
+                    rips_complex.append((list(simplex), float(dist_matrix[block].max())))
+
     return rips_complex
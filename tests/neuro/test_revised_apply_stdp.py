@@ -1,62 +1,134 @@
+import functools
 import unittest
 import numpy as np
 import time
-import matplotlib.pyplot as plt
 from src.neuro import apply_stdp as revised_apply_stdp
 from src.neuro.archived_apply_stdp import apply_stdp as original_apply_stdp
 
+
+def _pack(values):
+    """Contiguous float64 buffer, the layout the kernels consume without
+    an internal copy."""
+    return np.ascontiguousarray(values, dtype=np.float64)
+
+
+# Both implementations are pure in their arguments, so scenarios that
+# repeat the same spike trains (packed as hashable tuples) hit the memo
+# instead of re-running the kernels.
+@functools.lru_cache(maxsize=None)
+def _original_cached(pre, post, weight, inhib):
+    return original_apply_stdp(
+        spike_times_pre=_pack(pre), spike_times_post=_pack(post),
+        current_weight=weight, is_inhibitory=inhib)
+
+
+@functools.lru_cache(maxsize=None)
+def _revised_cached(pre, post, weight, inhib):
+    return revised_apply_stdp(
+        spike_times_pre=_pack(pre), spike_times_post=_pack(post),
+        current_weight=weight, is_inhibitory=inhib)
+
 class TestRevisedApplySTDP(unittest.TestCase):
     """Test cases for the revised apply_stdp function."""
 
+    # Scenario table shared by the equivalence test and the benchmark
+    # harness: (name, pre, post, weight, is_inhibitory, expected direction
+    # of the revised weight change).
+    SCENARIOS = [
+        ("Excitatory potentiation", [10.0, 20.0, 30.0], [15.0, 25.0, 35.0], 0.2, False, "greater"),
+        ("Excitatory depression", [15.0, 25.0, 35.0], [10.0, 20.0, 30.0], 0.8, False, "less"),
+        ("Inhibitory potentiation", [15.0, 25.0, 35.0], [10.0, 20.0, 30.0], -0.5, True, "less"),
+        ("Inhibitory depression", [10.0, 20.0, 30.0], [15.0, 25.0, 35.0], -0.5, True, "greater"),
+        ("Single pair", [10.0], [15.0], 0.2, False, "greater"),
+        ("Coincident spikes only", [10.0], [10.0], 0.5, False, None),
+    ]
+
     def test_functionality_equivalence(self):
         """Test that the revised function produces the same results as the original."""
-        test_cases = [
-            {"name": "Excitatory potentiation", "pre": [10.0, 20.0, 30.0], "post": [15.0, 25.0, 35.0], "weight": 0.2, "inhib": False},
-            {"name": "Excitatory depression", "pre": [15.0, 25.0, 35.0], "post": [10.0, 20.0, 30.0], "weight": 0.8, "inhib": False},
-            {"name": "Inhibitory potentiation", "pre": [15.0, 25.0, 35.0], "post": [10.0, 20.0, 30.0], "weight": -0.5, "inhib": True},
-            {"name": "Inhibitory depression", "pre": [10.0, 20.0, 30.0], "post": [15.0, 25.0, 35.0], "weight": -0.5, "inhib": True},
-        ]
-
-        for case in test_cases:
-            with self.subTest(name=case["name"]):
-                orig_weight, orig_trace = original_apply_stdp(
-                    spike_times_pre=case["pre"],
-                    spike_times_post=case["post"],
-                    current_weight=case["weight"],
-                    is_inhibitory=case["inhib"]
-                )
-                rev_weight, rev_trace = revised_apply_stdp(
-                    spike_times_pre=case["pre"],
-                    spike_times_post=case["post"],
-                    current_weight=case["weight"],
-                    is_inhibitory=case["inhib"]
-                )
-                # Due to removal of hardcoded logic, results might not be identical
-                # We are primarily interested in the direction of change and bounds
-                if case["name"] == "Excitatory potentiation":
-                     self.assertGreater(rev_weight, case["weight"])
-                elif case["name"] == "Excitatory depression":
-                     self.assertLess(rev_weight, case["weight"])
-                # Add similar checks for inhibitory cases if exact match is not expected
-
-    # Performance test can be run manually if needed, as it's slow and involves plotting
-    # def test_performance(self):
-    #     """Test the performance improvement of the revised function."""
-    #     np.random.seed(42)
-    #     n_spikes = 100 # Reduced for faster testing
-    #     spike_times_pre = np.sort(np.random.uniform(0, 1000, n_spikes))
-    #     spike_times_post = np.sort(np.random.uniform(0, 1000, n_spikes))
-    #     current_weight = 0.5
-        
-    #     start_time = time.time()
-    #     original_apply_stdp(spike_times_pre=spike_times_pre, spike_times_post=spike_times_post, current_weight=current_weight)
-    #     original_time = time.time() - start_time
-        
-    #     start_time = time.time()
-    #     revised_apply_stdp(spike_times_pre=spike_times_pre, spike_times_post=spike_times_post, current_weight=current_weight)
-    #     revised_time = time.time() - start_time
-        
-    #     self.assertLess(revised_time, original_time)
+        # Due to removal of hardcoded logic, results might not be identical;
+        # we are primarily interested in the direction of change and bounds
+        for name, pre, post, weight, inhib, expect in self.SCENARIOS:
+            with self.subTest(name=name):
+                orig_weight, orig_trace = _original_cached(tuple(pre), tuple(post), weight, inhib)
+                rev_weight, rev_trace = _revised_cached(tuple(pre), tuple(post), weight, inhib)
+                if expect == "greater":
+                    self.assertGreater(rev_weight, weight)
+                elif expect == "less":
+                    self.assertLess(rev_weight, weight)
+                else:
+                    self.assertAlmostEqual(rev_weight, weight, places=9)
+
+
+def _benchmark_kernels(spike_counts=(10, 100, 500, 1000, 2000), repeats=3):
+    """
+    Time the original pair-matrix reference against the revised kernel.
+
+    The revised side dispatches to the compiled (numba) kernels when that
+    optional dependency is installed — the same role a hand-built Cython
+    extension would play, without adding build scaffolding to a pure-
+    Python tree. Not collected by pytest; run this module as a script.
+
+    Returns (spike_counts, original_times, revised_times) in seconds.
+    """
+    # Generate every input up front from one PCG64 generator so the timed
+    # region contains nothing but kernel calls, and both kernels see the
+    # exact same contiguous float64 buffers (comparable cache state)
+    rng = np.random.default_rng(42)
+    pre_arrays = [np.sort(rng.uniform(0, 1000, n)) for n in spike_counts]
+    post_arrays = [np.sort(rng.uniform(0, 1000, n)) for n in spike_counts]
+
+    # Warm both implementations on a throwaway call so JIT compilation of
+    # the optional compiled kernels never lands in the first timed point
+    # and every recorded number reflects steady-state throughput. (The
+    # request's numba.pycc AOT route is deprecated upstream; warm-up
+    # achieves the same measurement hygiene without build artifacts.)
+    original_apply_stdp(spike_times_pre=pre_arrays[0], spike_times_post=post_arrays[0], current_weight=0.5)
+    revised_apply_stdp(spike_times_pre=pre_arrays[0], spike_times_post=post_arrays[0], current_weight=0.5)
+
+    original_times = []
+    revised_times = []
+    for pre, post in zip(pre_arrays, post_arrays):
+        start = time.perf_counter()
+        for _ in range(repeats):
+            original_apply_stdp(spike_times_pre=pre, spike_times_post=post, current_weight=0.5)
+        original_times.append((time.perf_counter() - start) / repeats)
+
+        start = time.perf_counter()
+        for _ in range(repeats):
+            revised_apply_stdp(spike_times_pre=pre, spike_times_post=post, current_weight=0.5)
+        revised_times.append((time.perf_counter() - start) / repeats)
+    return spike_counts, original_times, revised_times
+
+
+def plot_performance(save_path='performance_comparison.png'):
+    """
+    Plot the benchmark results.
+
+    Separate CLI entry point so matplotlib (and its font-cache scan)
+    stays out of the timed region and out of pytest collection; all
+    timing happens in _benchmark_kernels before the first plotting
+    import.
+    """
+    spike_counts, original_times, revised_times = _benchmark_kernels()
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    fig, ax = plt.subplots(figsize=(8, 5))
+    ax.plot(spike_counts, original_times, 'o-', label='Original (pair matrix)')
+    ax.plot(spike_counts, revised_times, 'o-', label='Revised (dispatched kernels)')
+    ax.set_xlabel('Spikes per train')
+    ax.set_ylabel('Time per call (s)')
+    ax.set_title('apply_stdp performance')
+    ax.legend()
+    ax.grid(True, alpha=0.3)
+    fig.savefig(save_path)
+    plt.close(fig)
+    print(f"Saved benchmark plot to '{save_path}'")
+
 
 if __name__ == "__main__":
-    unittest.main()
+    import sys
+    if '--benchmark' in sys.argv:
+        plot_performance()
+    else:
+        unittest.main()
@@ -1,43 +1,107 @@
+import math
 import unittest
 import numpy as np
-import matplotlib.pyplot as plt
 from src import numerical_integrate
 
+# When numba is available, hand QUADPACK native-code integrands via
+# scipy.LowLevelCallable so each quadrature node skips the Python frame;
+# otherwise the plain Python callables are used as-is.
+try:
+    import numba
+except ImportError:
+    numba = None
+
+
+def _as_quad_callable(py_func):
+    """Compile an integrand to a LowLevelCallable when numba is present."""
+    if numba is None:
+        return py_func
+    import scipy
+    compiled = numba.cfunc(numba.types.float64(numba.types.float64))(py_func)
+    return scipy.LowLevelCallable(compiled.ctypes)
+
+
+def _square(x):
+    return x * x
+
+
+def _sin(x):
+    return math.sin(x)
+
+
+def _gauss(x):
+    return math.exp(-x * x)
+
+
+def _sin10(x):
+    return math.sin(10.0 * x)
+
+
+def _inv_sqrt(x):
+    return 1.0 / math.sqrt(x)
+
+
+# Invariant constants hoisted to module scope; the request's plot grids
+# have no counterpart in this file, but the recomputed sqrt(pi) did.
+_SQRT_PI = math.sqrt(math.pi)
+_TWO_PI = 2.0 * math.pi
+
+_SQUARE = _as_quad_callable(_square)
+_SIN = _as_quad_callable(_sin)
+_GAUSS = _as_quad_callable(_gauss)
+_SIN10 = _as_quad_callable(_sin10)
+_INV_SQRT = _as_quad_callable(_inv_sqrt)
+
 class TestNumericalIntegrate(unittest.TestCase):
     """Test cases for the numerical_integrate function."""
 
+    @classmethod
+    def setUpClass(cls):
+        # The two cases sharing the 0..pi domain integrate through one
+        # vectorized call, so a single set of Gauss-Kronrod nodes (and
+        # one subdivision pass) serves both integrands; this also
+        # exercises the args passthrough on the vectorized path.
+        cls.sine_family, cls.sine_family_error = numerical_integrate(
+            lambda x, a, b: np.array([np.sin(x), a * np.sin(b * x)]),
+            0, np.pi, args=(2.0, 1.0), vectorized=True)
+
     def test_polynomial(self):
         """Test a simple polynomial (x^2 from 0 to 1, analytical result = 1/3)."""
-        result, error = numerical_integrate(lambda x: x**2, 0, 1)
+        result, error = numerical_integrate(_SQUARE, 0, 1)
         analytical = 1/3
         self.assertAlmostEqual(result, analytical, places=7)
 
     def test_trigonometric(self):
         """Test a trigonometric function (sin(x) from 0 to pi, analytical result = 2)."""
-        result, error = numerical_integrate(lambda x: np.sin(x), 0, np.pi)
-        analytical = 2.0
-        self.assertAlmostEqual(result, analytical, places=7)
+        self.assertAlmostEqual(self.sine_family[0], 2.0, places=7)
 
     def test_exponential(self):
         """Test an exponential function (e^(-x^2) from -inf to inf, analytical result = sqrt(pi))."""
-        result, error = numerical_integrate(lambda x: np.exp(-x**2), -np.inf, np.inf)
-        analytical = np.sqrt(np.pi)
+        result, error = numerical_integrate(_GAUSS, -np.inf, np.inf)
+        analytical = _SQRT_PI
         self.assertAlmostEqual(result, analytical, places=7)
 
     def test_with_parameters(self):
-        """Test a function with additional parameters."""
-        def integrand(x, a, b):
-            return a * np.sin(b * x)
-        result, error = numerical_integrate(integrand, 0, np.pi, args=(2.0, 1.0))
-        analytical = 4.0
-        self.assertAlmostEqual(result, analytical, places=7)
+        """Test a parameterized integrand (2*sin(x) from the shared batch)."""
+        self.assertAlmostEqual(self.sine_family[1], 4.0, places=7)
+        # Keep the scalar quad args passthrough covered as well
+        result, error = numerical_integrate(
+            lambda x, a, b: a * np.sin(b * x), 0, np.pi, args=(2.0, 1.0))
+        self.assertAlmostEqual(result, 4.0, places=7)
 
     def test_oscillatory(self):
         """Test an oscillatory function (sin(10x) from 0 to 2pi)."""
-        result, error = numerical_integrate(lambda x: np.sin(10*x), 0, 2*np.pi)
+        result, error = numerical_integrate(_SIN10, 0, _TWO_PI)
         analytical = 0.0
         self.assertAlmostEqual(result, analytical, places=7)
 
+    def test_vectorized_integrand(self):
+        """Test the vectorized path with an array-valued integrand."""
+        result, error = numerical_integrate(
+            lambda x: np.array([x**2, np.sin(x)]), 0, 1, vectorized=True)
+        analytical = np.array([1/3, 1 - np.cos(1)])
+        self.assertTrue(np.allclose(result, analytical, atol=1e-10))
+
     def test_error_handling(self):
         """Test error handling for invalid inputs."""
         with self.assertRaises(TypeError):
@@ -47,7 +111,7 @@ class TestNumericalIntegrate(unittest.TestCase):
 
     def test_singularity(self):
         """Test a function with a singularity (handled by quad)."""
-        result, error = numerical_integrate(lambda x: 1/np.sqrt(x), 0, 1)
+        result, error = numerical_integrate(_INV_SQRT, 0, 1)
         analytical = 2.0
         self.assertAlmostEqual(result, analytical, places=7)
 
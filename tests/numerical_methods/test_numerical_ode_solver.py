@@ -8,16 +8,42 @@ import unittest
 import numpy as np
 from src import numerical_ode_solver
 
+# When numba is available the right-hand sides compile to native code,
+# cutting the per-step Python callback cost inside solve_ivp; the same
+# functions run interpreted otherwise.
+try:
+    import numba
+except ImportError:
+    numba = None
+
+
+def _maybe_njit(func):
+    """Compile an ODE right-hand side with numba when available."""
+    if numba is None:
+        return func
+    return numba.njit(cache=True)(func)
+
 class TestNumericalOdeSolver(unittest.TestCase):
     """Test cases for the numerical_ode_solver function."""
     
+    @classmethod
+    def setUpClass(cls):
+        # Shared, contiguous float64 fixtures built once for the class:
+        # repeated linspace/list allocations (and SciPy's per-call dtype
+        # coercion) drop out of every test body
+        cls.T_SPAN_10 = (0, 10)
+        cls.T_EVAL_11 = np.linspace(0, 10, 11)
+        cls.Y0_DECAY = np.array([1.0])
+        cls.Y0_HARMONIC = np.array([1.0, 0.0])
+    
     def test_exponential_decay(self):
         """Test solving a simple exponential decay ODE."""
+        @_maybe_njit
         def exponential_decay(t, y, rate_constant):
             return -rate_constant * y
         
-        t_span = (0, 10)
-        y0 = [1.0]
+        t_span = self.T_SPAN_10
+        y0 = self.Y0_DECAY
         rate_constant = 0.1
         
         sol = numerical_ode_solver(exponential_decay, t_span, y0, args=(rate_constant,))
@@ -32,37 +58,37 @@ class TestNumericalOdeSolver(unittest.TestCase):
     
     def test_harmonic_oscillator(self):
         """Test solving a harmonic oscillator ODE."""
+        @_maybe_njit
         def harmonic_oscillator(t, y, omega):
             x, v = y
             dxdt = v
             dvdt = -(omega**2) * x
-            return [dxdt, dvdt]
+            # An array return (not a list) keeps the function numba-typable
+            return np.array([dxdt, dvdt])
         
         omega = 2.0
-        t_span = (0, 10)
-        y0 = [1.0, 0.0]  # Initial position and velocity
+        t_span = self.T_SPAN_10
+        y0 = self.Y0_HARMONIC  # Initial position and velocity
         
         sol = numerical_ode_solver(harmonic_oscillator, t_span, y0, args=(omega,))
         
-        # Check if the solution is close to the analytical solution at several points
-        for i in range(min(5, len(sol.t))):
-            t = sol.t[i]
-            x_numerical = sol.y[0, i]
-            v_numerical = sol.y[1, i]
-            
-            x_analytical = y0[0] * np.cos(omega * t)
-            v_analytical = -y0[0] * omega * np.sin(omega * t)
-            
-            self.assertAlmostEqual(x_numerical, x_analytical, places=2)
-            self.assertAlmostEqual(v_numerical, v_analytical, places=2)
+        # Check the solution against the analytical one at several points
+        # with two vectorized comparisons instead of per-point asserts
+        n_check = min(5, len(sol.t))
+        t_check = sol.t[:n_check]
+        x_analytical = y0[0] * np.cos(omega * t_check)
+        v_analytical = -y0[0] * omega * np.sin(omega * t_check)
+        np.testing.assert_allclose(sol.y[0, :n_check], x_analytical, atol=5e-3)
+        np.testing.assert_allclose(sol.y[1, :n_check], v_analytical, atol=5e-3)
     
     def test_lotka_volterra(self):
         """Test solving the Lotka-Volterra predator-prey model."""
+        @_maybe_njit
         def lotka_volterra(t, z, a, b, c, d):
             x, y = z
             dx_dt = a * x - b * x * y
             dy_dt = -c * y + d * x * y
-            return [dx_dt, dy_dt]
+            return np.array([dx_dt, dy_dt])
         
         t_span = (0, 1)  # Short time span for testing
         y0 = [10, 5]
@@ -78,17 +104,18 @@ class TestNumericalOdeSolver(unittest.TestCase):
         # Check conservation properties (not exact but should be close)
         # For certain parameter values, there are conservation laws
         if params == (1, 1, 1, 1):
-            for i in range(len(sol.t)):
-                x, y = sol.y[0, i], sol.y[1, i]
-                # The quantity x*y*e^(-(x+y)) is approximately conserved
-                conserved = x * y * np.exp(-(x + y))
-                initial_conserved = y0[0] * y0[1] * np.exp(-(y0[0] + y0[1]))
-                self.assertAlmostEqual(conserved, initial_conserved, places=1)
+            # The quantity x*y*e^(-(x+y)) is approximately conserved;
+            # evaluate it over the whole trajectory in one expression
+            x, y = sol.y[0], sol.y[1]
+            conserved = x * y * np.exp(-(x + y))
+            initial_conserved = y0[0] * y0[1] * np.exp(-(y0[0] + y0[1]))
+            np.testing.assert_allclose(conserved, initial_conserved, atol=5e-2)
     
     def test_stiff_system(self):
         """Test solving a stiff ODE system with different methods."""
+        @_maybe_njit
         def stiff_system(t, y, lambda1, lambda2):
-            return [lambda1 * y[0], lambda2 * y[1]]
+            return np.array([lambda1 * y[0], lambda2 * y[1]])
         
         lambda1 = -0.1
         lambda2 = -100.0  # Not too stiff for testing
@@ -105,18 +132,31 @@ class TestNumericalOdeSolver(unittest.TestCase):
                 method=method
             )
             
-            # Check if the solution is close to the analytical solution
-            t_final = sol.t[-1]
-            y1_numerical = sol.y[0, -1]
-            y2_numerical = sol.y[1, -1]
-            
-            y1_analytical = np.exp(lambda1 * t_final)
-            y2_analytical = np.exp(lambda2 * t_final)
-            
+            # Check the final state against the analytical solution in
+            # one array comparison (looser tolerance on the stiff
+            # component, matching the old per-scalar places)
             self.assertTrue(sol.success)
-            self.assertAlmostEqual(y1_numerical, y1_analytical, places=2)
-            # For the stiff component, we use a lower precision
-            self.assertAlmostEqual(y2_numerical, y2_analytical, places=1)
+            t_final = sol.t[-1]
+            y_numerical = sol.y[:, -1]
+            y_analytical = np.exp(np.array([lambda1, lambda2]) * t_final)
+            np.testing.assert_allclose(y_numerical, y_analytical, atol=5e-2)
+            self.assertAlmostEqual(y_numerical[0], y_analytical[0], places=2)
+    
+    def test_batched_diagonal_systems(self):
+        """Batch independent decay systems into one vectorized solve."""
+        rates = np.array([-0.1, -1.0, -100.0])
+        
+        def stacked_decay(t, y):
+            # Works on y of shape (3,) or (3, k): one call advances all
+            # three independent systems
+            return rates.reshape(3, *([1] * (y.ndim - 1))) * y
+        
+        sol = numerical_ode_solver(
+            stacked_decay, (0, 10), [1.0, 1.0, 1.0], vectorized=True)
+        
+        self.assertTrue(sol.success)
+        y_analytical = np.exp(rates * sol.t[-1])
+        np.testing.assert_allclose(sol.y[:, -1], y_analytical, atol=1e-2)
     
     def test_input_validation(self):
         """Test input validation for various error conditions."""
@@ -151,16 +191,15 @@ class TestNumericalOdeSolver(unittest.TestCase):
         def exponential_decay(t, y):
             return -0.1 * y
         
-        t_span = (0, 10)
-        y0 = [1.0]
-        t_eval = np.linspace(0, 10, 11)  # 11 evenly spaced points
+        t_span = self.T_SPAN_10
+        y0 = self.Y0_DECAY
+        t_eval = self.T_EVAL_11  # 11 evenly spaced points
         
         sol = numerical_ode_solver(exponential_decay, t_span, y0, t_eval=t_eval)
         
-        # Check if the output times match t_eval
+        # Check if the output times match t_eval in a single comparison
         self.assertEqual(len(sol.t), len(t_eval))
-        for i in range(len(t_eval)):
-            self.assertAlmostEqual(sol.t[i], t_eval[i])
+        np.testing.assert_allclose(sol.t, t_eval, atol=1e-7)
 
 if __name__ == "__main__":
     unittest.main(verbosity=2)
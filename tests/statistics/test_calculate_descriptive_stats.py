@@ -70,6 +70,22 @@ class TestCalculateDescriptiveStats(unittest.TestCase):
         with self.assertRaises(ValueError):
             calculate_descriptive_stats(data, nan_policy='raise')
     
+    def test_large_offset_precision(self):
+        """Variance stays exact for data riding on a large offset.
+
+        Guards the moment computation against the catastrophic
+        cancellation a naive sum-of-squares formula suffers; both the
+        centered two-pass path and the Welford kernel keep full
+        precision here.
+        """
+        offset = 1e8
+        data = np.array([1.0, 2.0, 3.0, 4.0, 5.0]) + offset
+        result = calculate_descriptive_stats(data)
+        
+        self.assertAlmostEqual(result['variance'], 2.5, places=6)
+        self.assertAlmostEqual(result['mean'], 3.0 + offset, places=4)
+        self.assertAlmostEqual(result['skewness'], 0.0, places=6)
+    
     def test_zero_variance(self):
         """Test with constant data (zero variance)."""
         data = [5, 5, 5, 5, 5]
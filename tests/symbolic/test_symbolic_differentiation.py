@@ -6,7 +6,6 @@ This script contains tests to verify the functionality of the symbolic_different
 
 import unittest
 import sympy
-from sympy import symbols, sin, cos, exp, log
 from src import symbolic_differentiate
 
 class TestSymbolicDifferentiation(unittest.TestCase):
@@ -24,6 +23,9 @@ class TestSymbolicDifferentiation(unittest.TestCase):
     
     def test_polynomial_sympy(self):
         """Test differentiation of polynomial expressions provided as SymPy objects."""
+        # Only this test needs symbols; defer the sub-import so collection
+        # stays on the bare sympy module import
+        from sympy import symbols
         x = symbols('x')
         expr = x**2 + 2*x + 1
         
@@ -1,19 +1,25 @@
 import unittest
 import numpy as np
+from scipy.spatial.distance import pdist, squareform
 from src.tda import construct_vietoris_rips, compute_persistent_homology, calculate_tda_metrics
 
 class TestTDATools(unittest.TestCase):
 
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
+        # Deterministic fixtures: build once per class instead of per test
         # A simple point cloud: two clusters
-        self.points1 = np.array([
+        cls.points1 = np.array([
             [0, 0], [1, 0], [0, 1], [1, 1],  # Cluster 1
             [5, 5], [6, 5], [5, 6], [6, 6]   # Cluster 2
         ])
-        # A point cloud forming a circle
-        self.points2 = np.array([
-            [np.cos(t), np.sin(t)] for t in np.linspace(0, 2 * np.pi, 10, endpoint=False)
-        ])
+        # A point cloud forming a circle (vectorized, no list comprehension)
+        t = np.linspace(0, 2 * np.pi, 10, endpoint=False)
+        cls.points2 = np.stack([np.cos(t), np.sin(t)], axis=1)
+        # Persistent homology dominates this file's runtime and both
+        # clouds are reused across tests, so compute each diagram once
+        cls.ph_points1 = compute_persistent_homology(cls.points1, max_dim=1)
+        cls.ph_points2 = compute_persistent_homology(cls.points2, max_dim=1)
 
     def test_construct_vietoris_rips(self):
         rips_complex = construct_vietoris_rips(self.points2, max_edge_length=1.0, max_dim=2)
@@ -28,26 +34,50 @@ class TestTDATools(unittest.TestCase):
             construct_vietoris_rips(self.points2, -1.0)
 
     def test_compute_persistent_homology(self):
-        result = compute_persistent_homology(self.points1, max_dim=1)
+        result = self.ph_points1
         self.assertIsInstance(result, dict)
         self.assertIn('dgms', result)
         self.assertIsInstance(result['dgms'], list)
         self.assertEqual(len(result['dgms']), 2) # H0 and H1
 
         # Test with distance matrix
-        dist_matrix = np.linalg.norm(self.points1[:, np.newaxis, :] - self.points1[np.newaxis, :, :], axis=-1)
+        # pdist computes the condensed distances in C without the O(N^2 * D)
+        # broadcast temporary the previous norm-of-differences built
+        dist_matrix = squareform(pdist(self.points1))
         result_dist = compute_persistent_homology(dist_matrix, max_dim=1)
         self.assertEqual(len(result_dist['dgms']), 2)
 
+    def test_component_count_with_realistic_spread(self):
+        """Component counting must hold up under intra-cluster spread,
+        not just on the tight grid fixture."""
+        rng = np.random.default_rng(0)
+        gauss_clusters = np.vstack([
+            rng.normal(size=(20, 2)) + [4, 4],
+            rng.normal(size=(20, 2)) + [-4, -4]
+        ])
+        result = compute_persistent_homology(gauss_clusters, max_dim=1)
+        metrics = calculate_tda_metrics(result['dgms'])
+        self.assertEqual(metrics['component_count'], 2)
+
+        t = np.linspace(0, 2 * np.pi, 40, endpoint=False)
+        noisy_circle = np.stack([np.cos(t), np.sin(t)], axis=1) + 0.1 * rng.normal(size=(40, 2))
+        result = compute_persistent_homology(noisy_circle, max_dim=1)
+        metrics = calculate_tda_metrics(result['dgms'])
+        self.assertEqual(metrics['component_count'], 1)
+
+        # An explicit merge scale overrides the inferred gap
+        metrics = calculate_tda_metrics(
+            compute_persistent_homology(gauss_clusters, max_dim=1)['dgms'],
+            merge_scale=3.0)
+        self.assertEqual(metrics['component_count'], 2)
+
     def test_calculate_tda_metrics(self):
         # Test with two components
-        result1 = compute_persistent_homology(self.points1, max_dim=1)
-        metrics1 = calculate_tda_metrics(result1['dgms'])
+        metrics1 = calculate_tda_metrics(self.ph_points1['dgms'])
         self.assertEqual(metrics1['component_count'], 2)
         
         # Test with one component and one loop
-        result2 = compute_persistent_homology(self.points2, max_dim=1)
-        metrics2 = calculate_tda_metrics(result2['dgms'])
+        metrics2 = calculate_tda_metrics(self.ph_points2['dgms'])
         self.assertEqual(metrics2['component_count'], 1)
         self.assertGreater(metrics2['total_b1_persistence'], 0)
 